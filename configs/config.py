@@ -33,6 +33,7 @@ class DatabaseConfig:
 
     @staticmethod
     def postgres() -> Dict[str, str]:
+        # POSTGRES_HOST may also be a socket directory (e.g. /var/run/postgresql)
         return {
             "host": os.getenv("POSTGRES_HOST", "localhost"),
             "database": os.getenv("POSTGRES_DB", "dummyjson_db"),
@@ -57,6 +58,8 @@ class DatabaseConfig:
             "host": os.getenv("REDIS_HOST", "localhost"),
             "port": int(os.getenv("REDIS_PORT", "6379")),
             "db": int(os.getenv("REDIS_DB", "0")),
+            # e.g. /var/run/redis/redis.sock for a colocated server
+            "unix_socket_path": os.getenv("REDIS_SOCKET_PATH", ""),
         }
 
 
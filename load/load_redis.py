@@ -5,6 +5,9 @@ Load module - caching frequently accessed data in Redis
 import redis
 import json
 import time
+import msgpack
+import zstandard as zstd
+from functools import partial
 from typing import Any, Dict, List, Optional, Literal
 from pathlib import Path
 from configs.config import DatabaseConfig, PROCESSED_DIR
@@ -19,6 +22,8 @@ class RedisCache:
         self.redis_config = redis_config
         self.data_dir = Path(data_dir)
         self.client = None
+        self._compressor = None
+        self._decompressor = None
 
         # TTL settings (in seconds) for different entity types
         self.TTL_CONFIG = {
@@ -27,16 +32,47 @@ class RedisCache:
             "order": 1800,  # 30 minutes
         }
 
+        # Per-entity shortcuts bound straight to the universal methods
+        self.cache_user = partial(self.cache_item, "user")
+        self.get_user = partial(self.get_item, "user")
+        self.cache_product = partial(self.cache_item, "product")
+        self.get_product = partial(self.get_item, "product")
+        self.cache_order = partial(self.cache_item, "order")
+        self.get_order = partial(self.get_item, "order")
+
     def connect(self) -> None:
         """Connect to Redis"""
         try:
-            self.client = redis.Redis(
-                host=self.redis_config.get("host", "localhost"),
-                port=self.redis_config.get("port", 6379),
+            socket_path = self.redis_config.get("unix_socket_path")
+            if socket_path:
+                address = {
+                    "connection_class": redis.UnixDomainSocketConnection,
+                    "path": socket_path,
+                }
+            else:
+                address = {
+                    "host": self.redis_config.get("host", "localhost"),
+                    "port": self.redis_config.get("port", 6379),
+                    "socket_keepalive": True,
+                }
+
+            # RESP3 lets redis-py pick the hiredis C parser when it is installed;
+            # the blocking pool caps connections for multi-threaded readers
+            pool = redis.BlockingConnectionPool(
                 db=self.redis_config.get("db", 0),
-                decode_responses=True,
+                decode_responses=False,
                 socket_timeout=5,
+                socket_connect_timeout=5,
+                health_check_interval=30,
+                protocol=3,
+                max_connections=32,
+                **address,
             )
+            self.client = redis.Redis(connection_pool=pool)
+
+            # Values are stored as zstd-compressed MessagePack blobs
+            self._compressor = zstd.ZstdCompressor(level=3)
+            self._decompressor = zstd.ZstdDecompressor()
 
             self.client.ping()
             print("✓ Connected to Redis")
@@ -49,6 +85,7 @@ class RedisCache:
         """Close Redis connection"""
         if self.client:
             self.client.close()
+            self.client.connection_pool.disconnect()
             print("✓ Redis connection closed")
 
     def flush_all(self) -> None:
@@ -57,12 +94,20 @@ class RedisCache:
             self.client.flushdb()
             print("✓ Redis database flushed")
 
+    def _pack(self, data: Dict) -> bytes:
+        """Serialize an entity to a compressed binary blob"""
+        return self._compressor.compress(msgpack.packb(data, use_bin_type=True))
+
+    def _unpack(self, value: bytes) -> Dict:
+        """Deserialize a compressed binary blob back to an entity"""
+        return msgpack.unpackb(self._decompressor.decompress(value), raw=False)
+
     def cache_item(self, entity_type: EntityType, item_id: int, data: Dict) -> bool:
         """Universal method to cache any entity type"""
 
         try:
             key = f"{entity_type}:{item_id}"
-            value = json.dumps(data)
+            value = self._pack(data)
             ttl = self.TTL_CONFIG.get(entity_type, 3600)
 
             self.client.setex(name=key, time=ttl, value=value)
@@ -80,7 +125,7 @@ class RedisCache:
             value = self.client.get(key)
 
             if value:
-                return json.loads(value)
+                return self._unpack(value)
             return None
 
         except Exception as e:
@@ -93,9 +138,10 @@ class RedisCache:
         """Cache multiple items using Redis pipeline (batch mode)"""
         print(f"\n→ Caching {entity_type}s to Redis (batch mode)...")
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
-        pipe = self.client.pipeline()
+        # No MULTI/EXEC needed for independent SETEX calls
+        pipe = self.client.pipeline(transaction=False)
         ttl = self.TTL_CONFIG.get(entity_type, 3600)
         count = 0
 
@@ -103,12 +149,12 @@ class RedisCache:
             item_id = item.get("id") or item.get("_id")
             if item_id:
                 key = f"{entity_type}:{item_id}"
-                value = json.dumps(item)
+                value = self._pack(item)
                 pipe.setex(name=key, time=ttl, value=value)
                 count += 1
 
         pipe.execute()
-        elapsed = time.time() - start_time
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
 
         print(
             f"  ✓ Cached {count}/{len(items)} {entity_type}s in {elapsed:.3f}s (batch)"
@@ -121,30 +167,6 @@ class RedisCache:
         key = f"{entity_type}:{item_id}"
         return bool(self.client.delete(key))
 
-    def cache_user(self, user_id: int, user_data: Dict) -> bool:
-        """Cache user profile (wrapper for cache_item)"""
-        return self.cache_item("user", user_id, user_data)
-
-    def get_user(self, user_id: int) -> Optional[Dict]:
-        """Get user from cache (wrapper for get_item)"""
-        return self.get_item("user", user_id)
-
-    def cache_product(self, product_id: int, product_data: Dict) -> bool:
-        """Cache product (wrapper for cache_item)"""
-        return self.cache_item("product", product_id, product_data)
-
-    def get_product(self, product_id: int) -> Optional[Dict]:
-        """Get product from cache (wrapper for get_item)"""
-        return self.get_item("product", product_id)
-
-    def cache_order(self, order_id: int, order_data: Dict) -> bool:
-        """Cache order (wrapper for cache_item)"""
-        return self.cache_item("order", order_id, order_data)
-
-    def get_order(self, order_id: int) -> Optional[Dict]:
-        """Get order from cache (wrapper for get_item)"""
-        return self.get_item("order", order_id)
-
     def get_ttl(self, entity_type: EntityType, item_id: int) -> int:
         """Get remaining TTL for an item (in seconds)"""
         key = f"{entity_type}:{item_id}"
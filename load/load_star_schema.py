@@ -2,14 +2,141 @@
 Load module - loading data into Star Schema
 """
 
-import json
+import functools
 import time
 from pathlib import Path
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
+import ijson
+import numpy as np
+import orjson
+import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_values
 from configs.config import DatabaseConfig, PROCESSED_DIR
+from load.pg_copy import copy_frame, copy_rows, frame_rows
+
+# US holidays (simplified), encoded as month * 100 + day
+HOLIDAYS = [
+    101,  # New Year's Day
+    704,  # Independence Day
+    1225,  # Christmas Day
+]
+
+# US regions mapping
+REGIONS = {
+    "Northeast": ["NY", "PA", "NJ", "MA", "CT", "RI", "VT", "NH", "ME"],
+    "Southeast": [
+        "FL",
+        "GA",
+        "SC",
+        "NC",
+        "VA",
+        "WV",
+        "KY",
+        "TN",
+        "AL",
+        "MS",
+        "AR",
+        "LA",
+    ],
+    "Midwest": ["OH", "MI", "IN", "IL", "WI", "MN", "IA", "MO", "ND", "SD", "NE", "KS"],
+    "Southwest": ["TX", "OK", "NM", "AZ"],
+    "West": ["CA", "NV", "UT", "CO", "WY", "MT", "ID", "WA", "OR", "AK", "HI"],
+}
+# Inverse of REGIONS for O(1) state_code lookups
+STATE_TO_REGION = {
+    state: region for region, states in REGIONS.items() for state in states
+}
+
+# Dimensions before the fact table that references them
+STAR_TABLES_LOAD_ORDER = (
+    "star_dim_users",
+    "star_dim_products",
+    "star_dim_date",
+    "star_dim_location",
+    "star_fact_orders",
+)
+
+# Column order of the rows built for COPY
+USER_COLUMNS = (
+    "user_id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "full_name",
+    "age",
+    "gender",
+    "phone",
+    "birth_date",
+    "blood_group",
+    "university",
+    "role",
+)
+PRODUCT_COLUMNS = (
+    "product_id",
+    "title",
+    "description",
+    "category",
+    "brand",
+    "sku",
+    "price",
+    "discount_percentage",
+    "rating",
+    "stock",
+    "weight",
+    "warranty_info",
+    "availability_status",
+)
+# address_id only lives in the location staging table
+LOCATION_COLUMNS = (
+    "address_id",
+    "address_line",
+    "city",
+    "state",
+    "state_code",
+    "postal_code",
+    "country",
+    "region",
+    "latitude",
+    "longitude",
+)
+FACT_COLUMNS = (
+    "order_id",
+    "user_id",
+    "product_id",
+    "date_id",
+    "location_id",
+    "quantity",
+    "unit_price",
+    "discount_percentage",
+    "discount_amount",
+    "subtotal",
+    "total_amount",
+    "order_status",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_sql(path: str) -> str:
+    """Read a schema SQL file (cached per process)"""
+    return Path(path).read_text()
+
+
+def _fact_amounts(
+    price: np.ndarray, quantity: np.ndarray, discount_pct: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute subtotal, discount and total into one preallocated block
+
+    Values stay unrounded: the DECIMAL(10, 2) fact columns round on input.
+    """
+    subtotal, discount, total = np.empty((3, len(price)), dtype=np.float64)
+    np.multiply(price, quantity, out=subtotal)
+    np.divide(discount_pct, 100, out=discount)
+    np.multiply(subtotal, discount, out=discount)
+    np.subtract(subtotal, discount, out=total)
+
+    return subtotal, discount, total
 
 
 class StarSchemaLoader:
@@ -21,16 +148,21 @@ class StarSchemaLoader:
         self.conn = None
         self.cursor = None
 
+        # full_date -> date_id, filled before the fact load
+        self.date_cache = {}
+        # address_id -> location_id, filled by load_dim_location
+        self.address_location_map = {}
+
+        # Parsed input files, shared by loaders that read the same file
+        self._json_cache: Dict[str, List[Dict]] = {}
+
+        # Set by load_all_bulk() to run every loader in one transaction
+        self._defer_commit = False
+
     def connect(self) -> None:
         """Connect to PostgreSQL database"""
         try:
-            self.conn = psycopg2.connect(
-                database=self.db_config["database"],
-                user=self.db_config["user"],
-                password=self.db_config["password"],
-                host=self.db_config["host"],
-                port=self.db_config.get("port", 5432),
-            )
+            self.conn = self._open_connection()
             self.cursor = self.conn.cursor()
             print("✓ Connected to PostgreSQL (Star Schema)")
 
@@ -38,26 +170,36 @@ class StarSchemaLoader:
             print(f"✗ Database connection error: {e}")
             raise
 
+    def _open_connection(self):
+        """Open a new PostgreSQL connection from db_config"""
+        return psycopg2.connect(
+            database=self.db_config["database"],
+            user=self.db_config["user"],
+            password=self.db_config["password"],
+            host=self.db_config["host"],
+            port=self.db_config.get("port", 5432),
+        )
+
     def disconnect(self) -> None:
         """Close connection"""
         if self.cursor:
             self.cursor.close()
         if self.conn:
             self.conn.close()
+        self._json_cache.clear()
         print("✓ Connection closed")
 
     def create_schema(self) -> None:
         """Create Star Schema tables from SQL file"""
         print("\n→ Creating Star Schema tables...")
 
-        sql_file = Path("sql/create_tables_star.sql")
-        if not sql_file.exists():
+        sql_file = "sql/create_tables_star.sql"
+        try:
+            sql = _read_sql(sql_file)
+        except FileNotFoundError:
             print(f"✗ SQL file not found: {sql_file}")
             return
 
-        with open(sql_file, "r") as f:
-            sql = f.read()
-
         try:
             self.cursor.execute(sql)
             self.conn.commit()
@@ -78,35 +220,24 @@ class StarSchemaLoader:
 
         start_time = time.time()
 
-        # Transform to dimension format
-        dim_users = []
-        for user in users:
-            dim_users.append(
-                {
-                    "user_id": user["id"],
-                    "username": user.get("username"),
-                    "email": user.get("email"),
-                    "first_name": user.get("first_name"),
-                    "last_name": user.get("last_name"),
-                    "full_name": f"{user.get('first_name', '')} {user.get('last_name', '')}".strip(),
-                    "age": user.get("age"),
-                    "gender": user.get("gender"),
-                    "phone": user.get("phone"),
-                    "birth_date": user.get("birth_date"),
-                    "blood_group": user.get("blood_group"),
-                    "university": user.get("university"),
-                    "role": user.get("role", "user"),
-                }
-            )
-
-        # Batch insert
-        columns = list(dim_users[0].keys())
-        columns_str = ", ".join(columns)
-        values = [[record[col] for col in columns] for record in dim_users]
-
-        query = f"INSERT INTO star_dim_users ({columns_str}) VALUES %s ON CONFLICT (user_id) DO NOTHING"
-        execute_values(self.cursor, query, values, page_size=1000)
-        self.conn.commit()
+        # Transform to dimension format column-wise
+        df = pd.DataFrame(users).rename(columns={"id": "user_id"})
+        df["full_name"] = (
+            df["first_name"].fillna("") + " " + df["last_name"].fillna("")
+        ).str.strip()
+        df["role"] = df.get("role", "user")
+        df["age"] = df["age"].astype("Int64")
+        dim_users = frame_rows(df, USER_COLUMNS)
+
+        # Bulk load via COPY
+        copy_rows(
+            self.cursor,
+            "star_dim_users",
+            USER_COLUMNS,
+            dim_users,
+            conflict_key="user_id",
+        )
+        self._commit()
 
         elapsed = time.time() - start_time
 
@@ -133,31 +264,32 @@ class StarSchemaLoader:
             category_name = categories.get(category_id, {}).get("name", "Unknown")
 
             dim_products.append(
-                {
-                    "product_id": product["id"],
-                    "title": product.get("title"),
-                    "description": product.get("description"),
-                    "category": category_name,
-                    "brand": product.get("brand"),
-                    "sku": product.get("sku"),
-                    "price": product.get("price"),
-                    "discount_percentage": product.get("discount_percentage"),
-                    "rating": product.get("rating"),
-                    "stock": product.get("stock"),
-                    "weight": product.get("weight"),
-                    "warranty_info": product.get("warranty_info"),
-                    "availability_status": product.get("availability_status"),
-                }
+                (
+                    product["id"],
+                    product.get("title"),
+                    product.get("description"),
+                    category_name,
+                    product.get("brand"),
+                    product.get("sku"),
+                    product.get("price"),
+                    product.get("discount_percentage"),
+                    product.get("rating"),
+                    product.get("stock"),
+                    product.get("weight"),
+                    product.get("warranty_info"),
+                    product.get("availability_status"),
+                )
             )
 
-        # Batch insert
-        columns = list(dim_products[0].keys())
-        columns_str = ", ".join(columns)
-        values = [[record[col] for col in columns] for record in dim_products]
-
-        query = f"INSERT INTO star_dim_products ({columns_str}) VALUES %s ON CONFLICT (product_id) DO NOTHING"
-        execute_values(self.cursor, query, values, page_size=1000)
-        self.conn.commit()
+        # Bulk load via COPY
+        copy_rows(
+            self.cursor,
+            "star_dim_products",
+            PRODUCT_COLUMNS,
+            dim_products,
+            conflict_key="product_id",
+        )
+        self._commit()
 
         elapsed = time.time() - start_time
 
@@ -173,91 +305,45 @@ class StarSchemaLoader:
 
         start_time = time.time()
 
-        dates = self._generate_date_dimension(start_year, end_year)
-
-        # Batch insert
-        columns = list(dates[0].keys())
-        columns_str = ", ".join(columns)
-        values = [[record[col] for col in columns] for record in dates]
-
-        query = f"INSERT INTO star_dim_date ({columns_str}) VALUES %s ON CONFLICT (full_date) DO NOTHING"
-        execute_values(self.cursor, query, values, page_size=1000)
-        self.conn.commit()
+        # Generate every attribute server-side; nothing crosses the wire
+        self.cursor.execute(
+            """
+            INSERT INTO star_dim_date (
+                date_id, full_date, year, quarter, month, month_name, day,
+                day_of_week, day_name, week_of_year, is_weekend, is_holiday,
+                fiscal_year, fiscal_quarter
+            )
+            SELECT
+                ROW_NUMBER() OVER (ORDER BY d),
+                d::date,
+                EXTRACT(YEAR FROM d)::int,
+                EXTRACT(QUARTER FROM d)::int,
+                EXTRACT(MONTH FROM d)::int,
+                to_char(d, 'FMMonth'),
+                EXTRACT(DAY FROM d)::int,
+                EXTRACT(ISODOW FROM d)::int,  -- 1=Monday, 7=Sunday
+                to_char(d, 'FMDay'),
+                EXTRACT(WEEK FROM d)::int,
+                EXTRACT(ISODOW FROM d) >= 6,
+                (EXTRACT(MONTH FROM d) * 100 + EXTRACT(DAY FROM d))::int = ANY(%s),
+                -- Fiscal year: starts in October
+                EXTRACT(YEAR FROM d)::int + (EXTRACT(MONTH FROM d) >= 10)::int,
+                ((EXTRACT(MONTH FROM d)::int + 2) %% 12) / 3 + 1
+            FROM generate_series(
+                make_date(%s, 1, 1), make_date(%s, 12, 31), interval '1 day'
+            ) AS d
+            ON CONFLICT (full_date) DO NOTHING
+        """,
+            (HOLIDAYS, start_year, end_year),
+        )
+        loaded = self.cursor.rowcount
+        self._commit()
 
         elapsed = time.time() - start_time
 
-        print(f"  ✓ Generated and loaded {len(dates)} dates in {elapsed:.3f}s")
-
-        return {"records": len(dates), "time": elapsed}
+        print(f"  ✓ Generated and loaded {loaded} dates in {elapsed:.3f}s")
 
-    def _generate_date_dimension(self, start_year: int, end_year: int) -> List[Dict]:
-        """Generate date dimension with all date attributes"""
-
-        dates = []
-        current = datetime(start_year, 1, 1)
-        date_id = 1
-
-        # US holidays (simplified)
-        holidays = {
-            (1, 1): "New Year's Day",
-            (7, 4): "Independence Day",
-            (12, 25): "Christmas Day",
-        }
-
-        while current.year <= end_year:
-            month_names = [
-                "January",
-                "February",
-                "March",
-                "April",
-                "May",
-                "June",
-                "July",
-                "August",
-                "September",
-                "October",
-                "November",
-                "December",
-            ]
-            day_names = [
-                "Monday",
-                "Tuesday",
-                "Wednesday",
-                "Thursday",
-                "Friday",
-                "Saturday",
-                "Sunday",
-            ]
-
-            is_holiday = (current.month, current.day) in holidays
-
-            # Fiscal year: starts in October
-            fiscal_year = current.year if current.month < 10 else current.year + 1
-            fiscal_quarter = ((current.month - 10) % 12) // 3 + 1
-
-            dates.append(
-                {
-                    "date_id": date_id,
-                    "full_date": current.date(),
-                    "year": current.year,
-                    "quarter": (current.month - 1) // 3 + 1,
-                    "month": current.month,
-                    "month_name": month_names[current.month - 1],
-                    "day": current.day,
-                    "day_of_week": current.weekday() + 1,  # 1=Monday, 7=Sunday
-                    "day_name": day_names[current.weekday()],
-                    "week_of_year": current.isocalendar()[1],
-                    "is_weekend": current.weekday() >= 5,
-                    "is_holiday": is_holiday,
-                    "fiscal_year": fiscal_year,
-                    "fiscal_quarter": fiscal_quarter,
-                }
-            )
-
-            current += timedelta(days=1)
-            date_id += 1
-
-        return dates
+        return {"records": loaded, "time": elapsed}
 
     def load_dim_location(self) -> Dict[str, Any]:
         """Load dimension: location"""
@@ -270,73 +356,54 @@ class StarSchemaLoader:
 
         start_time = time.time()
 
-        # Determine region based on state
-        regions = {
-            "Northeast": ["NY", "PA", "NJ", "MA", "CT", "RI", "VT", "NH", "ME"],
-            "Southeast": [
-                "FL",
-                "GA",
-                "SC",
-                "NC",
-                "VA",
-                "WV",
-                "KY",
-                "TN",
-                "AL",
-                "MS",
-                "AR",
-                "LA",
-            ],
-            "Midwest": [
-                "OH",
-                "MI",
-                "IN",
-                "IL",
-                "WI",
-                "MN",
-                "IA",
-                "MO",
-                "ND",
-                "SD",
-                "NE",
-                "KS",
-            ],
-            "Southwest": ["TX", "OK", "NM", "AZ"],
-            "West": ["CA", "NV", "UT", "CO", "WY", "MT", "ID", "WA", "OR", "AK", "HI"],
-        }
-
-        def get_region(state_code: str) -> str:
-            for region, states in regions.items():
-                if state_code in states:
-                    return region
-            return "Other"
-
         # Transform to dimension format
         dim_locations = []
         for addr in addresses:
             state_code = addr.get("state_code", "")
             dim_locations.append(
-                {
-                    "address_line": addr.get("address_line"),
-                    "city": addr.get("city"),
-                    "state": addr.get("state"),
-                    "state_code": state_code,
-                    "postal_code": addr.get("postal_code"),
-                    "country": addr.get("country", "United States"),
-                    "region": get_region(state_code),
-                    "latitude": addr.get("latitude"),
-                    "longitude": addr.get("longitude"),
-                }
+                (
+                    addr["id"],
+                    addr.get("address_line"),
+                    addr.get("city"),
+                    addr.get("state"),
+                    state_code,
+                    addr.get("postal_code"),
+                    addr.get("country", "United States"),
+                    STATE_TO_REGION.get(state_code, "Other"),
+                    addr.get("latitude"),
+                    addr.get("longitude"),
+                )
             )
 
-        # Batch insert
-        columns = list(dim_locations[0].keys())
-        columns_str = ", ".join(columns)
-        values = [[record[col] for col in columns] for record in dim_locations]
+        # COPY into a staging table that keeps the source address_id; its
+        # location_id default draws from the target's sequence
+
+        self.cursor.execute(
+            """
+            CREATE TEMP TABLE stage_star_dim_location
+                (LIKE star_dim_location INCLUDING DEFAULTS, address_id INTEGER)
+                ON COMMIT DROP
+        """
+        )
+        copy_rows(
+            self.cursor, "stage_star_dim_location", LOCATION_COLUMNS, dim_locations
+        )
 
-        query = f"INSERT INTO star_dim_location ({columns_str}) VALUES %s RETURNING location_id"
-        execute_values(self.cursor, query, values, page_size=1000)
-        self.conn.commit()
+        # Move rows over and get address_id -> location_id in one roundtrip
+        location_columns = ", ".join(("location_id",) + LOCATION_COLUMNS[1:])
+        self.cursor.execute(
+            f"""
+            WITH ins AS (
+                INSERT INTO star_dim_location ({location_columns})
+                SELECT {location_columns} FROM stage_star_dim_location
+                RETURNING location_id
+            )
+            SELECT s.address_id, ins.location_id
+            FROM ins JOIN stage_star_dim_location s USING (location_id)
+        """
+        )
+        self.address_location_map = dict(self.cursor.fetchall())
+        self._commit()
 
         elapsed = time.time() - start_time
 
@@ -348,76 +415,76 @@ class StarSchemaLoader:
         """Load fact table: orders"""
         print("\n→ Loading star_fact_orders...")
 
-        orders = self._load_json("orders.json")
-        order_items = self._load_json("order_items.json")
+        # Stream the two large inputs, keeping only the fields the fact needs
+        orders_df = pd.DataFrame(
+            self._stream_json("orders.json", ("id", "user_id", "order_date", "status")),
+            columns=["order_id", "user_id", "order_date", "order_status"],
+        )
+        items_df = pd.DataFrame(
+            self._stream_json(
+                "order_items.json",
+                ("order_id", "product_id", "quantity", "price", "discount_percentage"),
+            ),
+            columns=[
+                "order_id",
+                "product_id",
+                "quantity",
+                "price",
+                "discount_percentage",
+            ],
+        )
         users = self._load_json("users.json")
         addresses = self._load_json("addresses.json")
 
-        if not orders or not order_items:
+        if orders_df.empty or items_df.empty:
             return {"records": 0, "time": 0}
 
         # Create lookups
         user_address_map = {u["id"]: u.get("address_id") for u in users}
-        address_location_map = self._get_address_location_mapping(addresses)
-
-        # Group order items by order_id
-        items_by_order = {}
-        for item in order_items:
-            order_id = item["order_id"]
-            items_by_order.setdefault(order_id, []).append(item)
+        address_location_map = (
+            self.address_location_map or self._get_address_location_mapping(addresses)
+        )
 
         start_time = time.time()
 
-        # Build fact records
-        fact_records = []
-        for order in orders:
-            order_id = order["id"]
-            user_id = order.get("user_id")
-            order_date = datetime.fromisoformat(order["order_date"]).date()
-
-            # Get location
-            address_id = user_address_map.get(user_id)
-            location_id = address_location_map.get(address_id)
-
-            # Get date_id
-            date_id = self._get_date_id(order_date)
-
-            # Process each item in the order
-            items = items_by_order.get(order_id, [])
-
-            for item in items:
-                discount_pct = item.get("discount_percentage", 0) or 0
-                unit_price = item.get("price", 0)
-                quantity = item.get("quantity", 0)
-                subtotal = unit_price * quantity
-                discount_amount = subtotal * (discount_pct / 100)
-                total = subtotal - discount_amount
-
-                fact_records.append(
-                    {
-                        "order_id": order_id,
-                        "user_id": user_id,
-                        "product_id": item.get("product_id"),
-                        "date_id": date_id,
-                        "location_id": location_id,
-                        "quantity": quantity,
-                        "unit_price": unit_price,
-                        "discount_percentage": discount_pct,
-                        "discount_amount": round(discount_amount, 2),
-                        "subtotal": round(subtotal, 2),
-                        "total_amount": round(total, 2),
-                        "order_status": order.get("status", "completed"),
-                    }
-                )
+        # Preload date lookup once instead of one SELECT per order
+        self.cursor.execute("SELECT full_date, date_id FROM star_dim_date")
+        self.date_cache = dict(self.cursor.fetchall())
+
+        # Attach order attributes to every item (inner join keeps order order)
+        df = orders_df.merge(items_df, on="order_id")
+
+        # C-level ISO parsing, memoized across repeated timestamps
+        order_days = pd.to_datetime(df["order_date"], format="ISO8601", cache=True)
+        df["date_id"] = order_days.dt.date.map(self._get_date_id)
+        df["location_id"] = (
+            df["user_id"].map(user_address_map).map(address_location_map)
+        ).astype("Int64")
+        df["user_id"] = df["user_id"].astype("Int64")
+        df["order_status"] = df["order_status"].fillna("completed")
+
+        # Vectorized line-item arithmetic
+        df["unit_price"] = df["price"].fillna(0)
+        df["discount_percentage"] = df["discount_percentage"].fillna(0)
+        (
+            df["subtotal"],
+            df["discount_amount"],
+            df["total_amount"],
+        ) = _fact_amounts(
+            df["unit_price"].to_numpy(np.float64),
+            df["quantity"].to_numpy(np.float64),
+            df["discount_percentage"].to_numpy(np.float64),
+        )
 
-        # Batch insert
-        columns = list(fact_records[0].keys())
-        columns_str = ", ".join(columns)
-        values = [[record[col] for col in columns] for record in fact_records]
+        # Nullable ints: a missing value is written as \N, not as a float "3.0"
+        for column in ("product_id", "quantity", "date_id"):
+            df[column] = df[column].astype("Int64")
 
-        query = f"INSERT INTO star_fact_orders ({columns_str}) VALUES %s"
-        execute_values(self.cursor, query, values, page_size=1000)
-        self.conn.commit()
+        # Bulk load via COPY
+        fact_records = df[list(FACT_COLUMNS)]
+        self.cursor.execute("SET LOCAL synchronous_commit = off")
+        copy_frame(self.cursor, "star_fact_orders", fact_records)
+        self._commit()
 
         elapsed = time.time() - start_time
 
@@ -425,35 +492,64 @@ class StarSchemaLoader:
 
         return {"records": len(fact_records), "time": elapsed}
 
-    def _get_date_id(self, date: datetime.date) -> int:
-        """Get date_id for a given date"""
+    def _commit(self) -> None:
+        """Commit the current load step unless running inside load_all_bulk()"""
+        if not self._defer_commit:
+            self.conn.commit()
+
+    def _drop_indexes(self, table: str) -> List[str]:
+        """Drop all non-primary-key indexes of a table, return their definitions"""
         self.cursor.execute(
-            "SELECT date_id FROM star_dim_date WHERE full_date = %s", (date,)
+            """
+            SELECT i.indexname, i.indexdef
+            FROM pg_indexes i
+            JOIN pg_class c ON c.relname = i.indexname
+            JOIN pg_index x ON x.indexrelid = c.oid
+            WHERE i.tablename = %s AND NOT x.indisprimary
+            """,
+            (table,),
         )
-        result = self.cursor.fetchone()
-        if result:
-            return result[0]
+        indexes = self.cursor.fetchall()
+
+        for index_name, _ in indexes:
+            self.cursor.execute(f"DROP INDEX {index_name}")
+
+        return [index_def for _, index_def in indexes]
+
+    def _recreate_indexes(self, index_defs: List[str]) -> None:
+        """Recreate indexes from definitions saved by _drop_indexes()"""
+        for index_def in index_defs:
+            self.cursor.execute(index_def)
+
+    def _get_date_id(self, date: datetime.date) -> int:
+        """Get date_id for a given date from the preloaded date cache"""
+        date_id = self.date_cache.get(date)
+        if date_id:
+            return date_id
         # Fallback: use YYYYMMDD as date_id
         return int(date.strftime("%Y%m%d"))
 
     def _get_address_location_mapping(self, addresses: List[Dict]) -> Dict[int, int]:
-        """Map address_id to location_id from database"""
-        mapping = {}
+        """Map address_id to location_id with a single location scan"""
+        self.cursor.execute(
+            """
+            SELECT location_id, city, state_code, postal_code
+            FROM star_dim_location
+            ORDER BY location_id
+        """
+        )
 
-        for addr in addresses:
-            # Query to find location_id by matching address attributes
-            self.cursor.execute(
-                """
-                SELECT location_id FROM star_dim_location
-                WHERE city = %s AND state_code = %s AND postal_code = %s
-                LIMIT 1
-            """,
-                (addr.get("city"), addr.get("state_code"), addr.get("postal_code")),
-            )
+        # First location per (city, state_code, postal_code) wins
+        locations = {}
+        for location_id, city, state_code, postal_code in self.cursor.fetchall():
+            locations.setdefault((city, state_code, postal_code), location_id)
 
-            result = self.cursor.fetchone()
-            if result:
-                mapping[addr["id"]] = result[0]
+        mapping = {}
+        for addr in addresses:
+            key = (addr.get("city"), addr.get("state_code"), addr.get("postal_code"))
+            location_id = locations.get(key)
+            if location_id:
+                mapping[addr["id"]] = location_id
 
         return mapping
 
@@ -463,14 +559,14 @@ class StarSchemaLoader:
         print("LOADING DIMENSION TABLES")
         print("=" * 80)
 
-        results = {}
-
-        results["dim_date"] = self.load_dim_date()
-        results["dim_users"] = self.load_dim_users()
-        results["dim_products"] = self.load_dim_products()
-        results["dim_location"] = self.load_dim_location()
+        loaders = {
+            "dim_date": self.load_dim_date,
+            "dim_users": self.load_dim_users,
+            "dim_products": self.load_dim_products,
+            "dim_location": self.load_dim_location,
+        }
 
-        return results
+        return {table: loader() for table, loader in loaders.items()}
 
     def load_all(self) -> Dict[str, Dict[str, Any]]:
         """Load complete Star Schema"""
@@ -494,6 +590,43 @@ class StarSchemaLoader:
 
         return results
 
+    def load_all_bulk(self) -> Dict[str, Dict[str, Any]]:
+        """Load complete Star Schema in a single UNLOGGED bulk-load transaction"""
+        self._defer_commit = True
+
+        try:
+            self.cursor.execute("SET LOCAL synchronous_commit TO OFF")
+
+            # Skip WAL while loading; the fact table references the dimensions,
+            # so it goes UNLOGGED first and back to LOGGED last
+            for table in STAR_TABLES_LOAD_ORDER[::-1]:
+                self.cursor.execute(f"ALTER TABLE {table} SET UNLOGGED")
+
+            # The fact COPY skips secondary index upkeep; dimensions keep
+            # theirs for the ON CONFLICT staging inserts
+            index_defs = self._drop_indexes("star_fact_orders")
+
+            results = self.load_all()
+
+            for table in STAR_TABLES_LOAD_ORDER:
+                self.cursor.execute(f"ALTER TABLE {table} SET LOGGED")
+
+            # SET LOGGED rewrites the table, so fact indexes are built once after it
+            self.cursor.execute("SET LOCAL maintenance_work_mem = '512MB'")
+            self._recreate_indexes(index_defs)
+            self.cursor.execute("ANALYZE star_fact_orders")
+
+            self.conn.commit()
+            return results
+
+        except Exception as e:
+            self.conn.rollback()
+            print(f"  ✗ Bulk load failed: {e}")
+            raise
+
+        finally:
+            self._defer_commit = False
+
     def get_stats(self) -> None:
         """Print Star Schema statistics"""
         print("\n" + "=" * 80)
@@ -513,16 +646,34 @@ class StarSchemaLoader:
             count = self.cursor.fetchone()[0]
             print(f"  • {table:25s}: {count:8d} records")
 
+    def _stream_json(self, filename: str, fields: Sequence[str]) -> Iterator[Tuple]:
+        """Stream a JSON array, yielding only the given fields of each item"""
+        file_path = self.data_dir / filename
+
+        if not file_path.exists():
+            print(f"  ⚠ File not found: {file_path}")
+            return
+
+        with open(file_path, "rb") as f:
+            for item in ijson.items(f, "item", use_float=True):
+                yield tuple(item.get(field) for field in fields)
+
     def _load_json(self, filename: str) -> List[Dict]:
-        """Load JSON file"""
+        """Load JSON file (parsed once per loader)"""
+        if filename in self._json_cache:
+            return self._json_cache[filename]
+
         file_path = self.data_dir / filename
 
         if not file_path.exists():
             print(f"  ⚠ File not found: {file_path}")
             return []
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
+
+        self._json_cache[filename] = data
+        return data
 
 
 def main():
@@ -539,7 +690,7 @@ def main():
         loader.create_schema()
 
         # Load all data
-        results = loader.load_all()
+        results = loader.load_all_bulk()
 
         # Print stats
         loader.get_stats()
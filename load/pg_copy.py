@@ -0,0 +1,65 @@
+"""
+COPY helpers shared by the star and snowflake schema loaders
+"""
+
+import csv
+import io
+from typing import List, Any, Optional, Sequence, Tuple
+import pandas as pd
+
+
+def copy_rows(
+    cursor,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    conflict_key: Optional[str] = None,
+) -> None:
+    """Bulk load rows via COPY (through a staging table for ON CONFLICT)"""
+    buf = io.StringIO()
+    writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
+    for row in rows:
+        writer.writerow(["\\N" if v is None else v for v in row])
+    buf.seek(0)
+
+    columns_str = ", ".join(columns)
+    target = table
+
+    if conflict_key:
+        target = f"stage_{table}"
+        cursor.execute(
+            f"CREATE TEMP TABLE {target} (LIKE {table} INCLUDING DEFAULTS) "
+            "ON COMMIT DROP"
+        )
+
+    cursor.copy_expert(
+        f"COPY {target} ({columns_str}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        buf,
+    )
+
+    if conflict_key:
+        cursor.execute(
+            f"INSERT INTO {table} ({columns_str}) "
+            f"SELECT {columns_str} FROM {target} "
+            f"ON CONFLICT ({conflict_key}) DO NOTHING"
+        )
+
+
+def frame_rows(df: pd.DataFrame, columns: Sequence[str]) -> List[Tuple[Any, ...]]:
+    """Convert DataFrame columns to row tuples (NaN/NA become None for COPY)"""
+    df = df.reindex(columns=columns).astype(object)
+    df = df.where(df.notna(), None)
+    return list(df.itertuples(index=False, name=None))
+
+
+def copy_frame(cursor, table: str, frame: pd.DataFrame) -> None:
+    """Bulk load a DataFrame via COPY (columns named as in the table)"""
+    buf = io.StringIO()
+    frame.to_csv(buf, header=False, index=False, na_rep="\\N")
+    buf.seek(0)
+
+    columns_str = ", ".join(frame.columns)
+    cursor.copy_expert(
+        f"COPY {table} ({columns_str}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        buf,
+    )
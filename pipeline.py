@@ -4,8 +4,11 @@ Orchestrates Extract → Transform → Load process for all storage systems
 """
 
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Callable, Dict, FrozenSet, NamedTuple, Set, Tuple
 
 from extract.extract import DataExtractor
 from transform.transform import DataNormalizer
@@ -18,13 +21,14 @@ from utils.logger import setup_pipeline_logger, log_performance, log_stats
 # Setup logger
 logger = setup_pipeline_logger()
 
+# Keeps each concurrent load step's stats and summary block contiguous
+_log_lock = threading.Lock()
+
 
 def print_banner(text: str) -> None:
-    """Print formatted banner"""
+    """Print formatted banner (one record, so concurrent steps can't split it)"""
     banner = "=" * 80
-    logger.info(f"\n{banner}")
-    logger.info(f"  {text}")
-    logger.info(banner)
+    logger.info(f"\n{banner}\n  {text}\n{banner}")
 
 
 def run_extract() -> bool:
@@ -37,16 +41,12 @@ def run_extract() -> bool:
         data = extractor.extract_from_api(save_to_file=True)
 
         elapsed = time.time() - start_time
-        total_records = sum(len(v) for v in data.values())
+        stats = {name.capitalize(): len(records) for name, records in data.items()}
+        total_records = sum(stats.values())
 
         log_performance(logger, "Extract", elapsed, total_records)
 
-        stats = {
-            "Products": len(data["products"]),
-            "Users": len(data["users"]),
-            "Carts": len(data["carts"]),
-            "Total records": total_records,
-        }
+        stats["Total records"] = total_records
         log_stats(logger, "Extraction Summary", stats)
 
         logger.info("✅ Extraction complete!")
@@ -64,14 +64,13 @@ def run_transform() -> bool:
 
     try:
         normalizer = DataNormalizer(data_dir=RAW_DIR, output_dir=PROCESSED_DIR)
-        tables = normalizer.normalize_all()
+        stats = normalizer.normalize_all()
 
         elapsed = time.time() - start_time
-        total_records = sum(len(v) for v in tables.values())
+        total_records = sum(stats.values())
 
         log_performance(logger, "Transform", elapsed, total_records)
 
-        stats = {table: len(records) for table, records in tables.items()}
         log_stats(logger, "Normalized Tables", stats)
 
         logger.info("✅ Transformation complete!")
@@ -94,25 +93,25 @@ def run_load_postgres() -> bool:
         logger.info("Connected to PostgreSQL")
 
         loader.create_schema()
-        logger.info("Schema created")
+        logger.info("PostgreSQL schema created")
 
         timing_results = loader.load_all_data()
 
-        loader.get_stats()
-        loader.disconnect()
-
-        elapsed = time.time() - start_time
-        total_records = sum(s["records"] for s in timing_results.values())
+        with _log_lock:
+            loader.get_stats()
+            loader.disconnect()
 
-        log_performance(logger, "Load PostgreSQL", elapsed, total_records)
+            elapsed = time.time() - start_time
+            total_records = sum(s["records"] for s in timing_results.values())
 
-        stats = {
-            table: f"{s['records']} records in {s['time']:.3f}s ({s['method']})"
-            for table, s in timing_results.items()
-        }
-        log_stats(logger, "PostgreSQL Loading Times", stats)
+            stats = {
+                table: f"{s['records']} records in {s['time']:.3f}s ({s['method']})"
+                for table, s in timing_results.items()
+            }
 
-        logger.info("✅ PostgreSQL load complete!")
+            log_performance(logger, "Load PostgreSQL", elapsed, total_records)
+            log_stats(logger, "PostgreSQL Loading Times", stats)
+            logger.info("✅ PostgreSQL load complete!")
         return True
 
     except Exception as e:
@@ -135,21 +134,22 @@ def run_load_mongo() -> bool:
         timing_results = loader.denormalize_and_load()
 
         loader.create_indexes()
-        loader.get_stats()
-        loader.disconnect()
 
-        elapsed = time.time() - start_time
-        total_docs = sum(s["records"] for s in timing_results.values())
+        with _log_lock:
+            loader.get_stats()
+            loader.disconnect()
 
-        log_performance(logger, "Load MongoDB", elapsed, total_docs)
+            elapsed = time.time() - start_time
+            total_docs = sum(s["records"] for s in timing_results.values())
 
-        stats = {
-            coll: f"{s['records']} documents in {s['time']:.3f}s"
-            for coll, s in timing_results.items()
-        }
-        log_stats(logger, "MongoDB Loading Times", stats)
+            stats = {
+                coll: f"{s['records']} documents in {s['time']:.3f}s"
+                for coll, s in timing_results.items()
+            }
 
-        logger.info("✅ MongoDB load complete!")
+            log_performance(logger, "Load MongoDB", elapsed, total_docs)
+            log_stats(logger, "MongoDB Loading Times", stats)
+            logger.info("✅ MongoDB load complete!")
         return True
 
     except Exception as e:
@@ -171,21 +171,21 @@ def run_load_redis() -> bool:
         cache.flush_all()
         results = cache.load_from_mongo_export()
 
-        cache.print_stats()
-        cache.disconnect()
+        with _log_lock:
+            cache.print_stats()
+            cache.disconnect()
 
-        elapsed = time.time() - start_time
-        total_cached = sum(s["cached"] for s in results.values())
+            elapsed = time.time() - start_time
+            total_cached = sum(s["cached"] for s in results.values())
 
-        log_performance(logger, "Cache Redis", elapsed, total_cached)
+            stats = {
+                entity: f"{s['cached']} records in {s['time']:.3f}s"
+                for entity, s in results.items()
+            }
 
-        stats = {
-            entity: f"{s['cached']} records in {s['time']:.3f}s"
-            for entity, s in results.items()
-        }
-        log_stats(logger, "Redis Caching Times", stats)
-
-        logger.info("✅ Redis cache complete!")
+            log_performance(logger, "Cache Redis", elapsed, total_cached)
+            log_stats(logger, "Redis Caching Times", stats)
+            logger.info("✅ Redis cache complete!")
         return True
 
     except Exception as e:
@@ -193,6 +193,70 @@ def run_load_redis() -> bool:
         return False
 
 
+class Step(NamedTuple):
+    """Pipeline step and the steps it depends on"""
+
+    name: str
+    func: Callable[[], bool]
+    deps: FrozenSet[str] = frozenset()
+
+
+# Load steps only read the processed files, so they all depend on Transform
+STEPS: Dict[str, Step] = {
+    "extract": Step("Extract", run_extract),
+    "transform": Step("Transform", run_transform, frozenset({"extract"})),
+    "postgres": Step("Load PostgreSQL", run_load_postgres, frozenset({"transform"})),
+    "mongo": Step("Load MongoDB", run_load_mongo, frozenset({"transform"})),
+    "redis": Step("Cache Redis", run_load_redis, frozenset({"transform"})),
+}
+
+
+def _run_timed(key: str, step_func: Callable[[], bool]) -> Tuple[str, bool, float]:
+    """Run a pipeline step and return (key, success, elapsed)"""
+    start_time = time.time()
+    success = step_func()
+    return key, success, time.time() - start_time
+
+
+def run_steps(
+    steps: Dict[str, Step]
+) -> Tuple[Dict[str, bool], Dict[str, float], Set[str]]:
+    """
+    Run steps concurrently as soon as all their dependencies succeed
+    Returns (results, step_times, skipped)
+    """
+    results: Dict[str, bool] = {}
+    step_times: Dict[str, float] = {}
+    skipped: Set[str] = set()
+    pending = dict(steps)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        while pending or running:
+            for key, step in list(pending.items()):
+                if any(
+                    dep in skipped or results.get(dep) is False for dep in step.deps
+                ):
+                    skipped.add(key)
+                    del pending[key]
+                elif all(results.get(dep) for dep in step.deps):
+                    running[executor.submit(_run_timed, key, step.func)] = key
+                    del pending[key]
+
+            if not running:
+                # Remaining steps depend on unknown steps
+                skipped.update(pending)
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, success, step_times[key] = future.result()
+                results[key] = success
+                del running[future]
+
+    return results, step_times, skipped
+
+
 def main():
     """Main ETL pipeline"""
 
@@ -207,24 +271,21 @@ def main():
     Path(RAW_DIR).mkdir(parents=True, exist_ok=True)
     Path(PROCESSED_DIR).mkdir(parents=True, exist_ok=True)
 
-    steps = [
-        ("Extract", run_extract),
-        ("Transform", run_transform),
-        ("Load PostgreSQL", run_load_postgres),
-        ("Load MongoDB", run_load_mongo),
-        ("Cache Redis", run_load_redis),
-    ]
-
-    results = {}
-
-    for step_name, step_func in steps:
-        success = step_func()
-        results[step_name] = success
-
-        if not success:
-            logger.error(f"\n⚠️  Pipeline stopped at step: {step_name}")
-            logger.error("Fix the error and run again.")
-            sys.exit(1)
+    results, step_times, skipped = run_steps(STEPS)
+
+    failed = [key for key, success in results.items() if not success]
+    if failed or skipped:
+        logger.error(
+            "\n⚠️  Pipeline failed at step(s): "
+            + ", ".join(STEPS[key].name for key in failed)
+        )
+        if skipped:
+            logger.error(
+                "Skipped: "
+                + ", ".join(STEPS[key].name for key in STEPS if key in skipped)
+            )
+        logger.error("Fix the error and run again.")
+        sys.exit(1)
 
     pipeline_elapsed = time.time() - pipeline_start
 
@@ -235,9 +296,9 @@ def main():
     logger.info(f"\n⏱  Total pipeline time: {pipeline_elapsed:.1f}s")
 
     logger.info("\nSteps executed:")
-    for i, (step_name, _) in enumerate(steps, 1):
-        status = "✅" if results[step_name] else "❌"
-        logger.info(f"  {i}. {status} {step_name}")
+    for i, (key, step) in enumerate(STEPS.items(), 1):
+        status = "✅" if results[key] else "❌"
+        logger.info(f"  {i}. {status} {step.name} ({step_times[key]:.1f}s)")
 
     logger.info("\n" + "=" * 80)
     logger.info("\n🎉 ETL Pipeline finished! Data is ready in:")
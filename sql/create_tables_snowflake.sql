@@ -147,45 +147,6 @@ CREATE TABLE snow_fact_orders (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- ============================================================================
--- INDEXES FOR PERFORMANCE
--- ============================================================================
-
--- Sub-dimension indexes
-CREATE INDEX idx_snow_dim_categories_parent ON snow_dim_categories(parent_category_id);
-CREATE INDEX idx_snow_dim_categories_slug ON snow_dim_categories(category_slug);
-CREATE INDEX idx_snow_dim_brands_name ON snow_dim_brands(brand_name);
-CREATE INDEX idx_snow_dim_states_code ON snow_dim_states(state_code);
-CREATE INDEX idx_snow_dim_states_region ON snow_dim_states(region);
-CREATE INDEX idx_snow_dim_cities_state ON snow_dim_cities(state_id);
-CREATE INDEX idx_snow_dim_cities_name ON snow_dim_cities(city_name);
-
--- Main dimension indexes
-CREATE INDEX idx_snow_dim_users_email ON snow_dim_users(email);
-CREATE INDEX idx_snow_dim_users_username ON snow_dim_users(username);
-CREATE INDEX idx_snow_dim_users_role ON snow_dim_users(role_id);
-CREATE INDEX idx_snow_dim_users_city ON snow_dim_users(city_id);
-
-CREATE INDEX idx_snow_dim_products_category ON snow_dim_products(category_id);
-CREATE INDEX idx_snow_dim_products_brand ON snow_dim_products(brand_id);
-CREATE INDEX idx_snow_dim_products_price ON snow_dim_products(price);
-CREATE INDEX idx_snow_dim_products_sku ON snow_dim_products(sku);
-
-CREATE INDEX idx_snow_dim_date_full_date ON snow_dim_date(full_date);
-CREATE INDEX idx_snow_dim_date_year_month ON snow_dim_date(year, month);
-CREATE INDEX idx_snow_dim_date_year_quarter ON snow_dim_date(year, quarter);
-
--- Fact table indexes
-CREATE INDEX idx_snow_fact_orders_user_id ON snow_fact_orders(user_id);
-CREATE INDEX idx_snow_fact_orders_product_id ON snow_fact_orders(product_id);
-CREATE INDEX idx_snow_fact_orders_date_id ON snow_fact_orders(date_id);
-CREATE INDEX idx_snow_fact_orders_order_id ON snow_fact_orders(order_id);
-
--- Composite indexes for snowflake queries
-CREATE INDEX idx_snow_fact_orders_date_product ON snow_fact_orders(date_id, product_id);
-CREATE INDEX idx_snow_fact_orders_date_user ON snow_fact_orders(date_id, user_id);
-CREATE INDEX idx_snow_fact_orders_user_product ON snow_fact_orders(user_id, product_id);
-
 -- ============================================================================
 -- COMMENTS
 -- ============================================================================
@@ -2,12 +2,124 @@
 Transform module - normalizes data to 3NF
 """
 
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timedelta
+from itertools import count
 from configs.config import RAW_DIR, PROCESSED_DIR
-import random
+from utils.logger import setup_logger, log_stats
+import multiprocessing
+import numpy as np
+import orjson
+import os
+import string
+import sys
+
+# Shared read-only default for missing nested objects
+EMPTY_DICT: Dict[str, Any] = {}
+
+logger = setup_logger(__name__, "transform.log")
+
+# Raw DummyJSON inputs and normalized output tables (in output order)
+RAW_FILES = ("users", "products", "carts")
+TABLE_NAMES = (
+    "addresses",
+    "banks",
+    "companies",
+    "categories",
+    "users",
+    "products",
+    "product_tags",
+    "product_images",
+    "reviews",
+    "orders",
+    "order_items",
+)
+
+_RNG = np.random.default_rng()
+
+_STATUSES = np.array(["completed", "pending", "shipped", "delivered"])
+
+# Category name → slug: lowercase ASCII letters, spaces become hyphens
+_SLUG_TRANS = str.maketrans(" " + string.ascii_uppercase, "-" + string.ascii_lowercase)
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings so repeated values share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class UserRow:
+    """Normalized users row"""
+
+    id: int
+    first_name: Optional[str]
+    last_name: Optional[str]
+    maiden_name: Optional[str]
+    age: Optional[int]
+    gender: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    username: Optional[str]
+    password: Optional[str]
+    birth_date: Optional[str]
+    image_url: Optional[str]
+    blood_group: Optional[str]
+    height: Optional[float]
+    weight: Optional[float]
+    eye_color: Optional[str]
+    hair_color: Optional[str]
+    hair_type: Optional[str]
+    ip_address: Optional[str]
+    mac_address: Optional[str]
+    user_agent: Optional[str]
+    university: Optional[str]
+    ein: Optional[str]
+    ssn: Optional[str]
+    role: Optional[str]
+    crypto_coin: Optional[str]
+    crypto_wallet: Optional[str]
+    crypto_network: Optional[str]
+    bank_id: Optional[int]
+    company_id: Optional[int]
+    address_id: Optional[int]
+
+
+@dataclass(slots=True)
+class ProductRow:
+    """Normalized products row"""
+
+    id: int
+    title: Optional[str]
+    description: Optional[str]
+    category_id: int
+    price: Optional[float]
+    discount_percentage: Optional[float]
+    rating: Optional[float]
+    stock: Optional[int]
+    brand: Optional[str]
+    sku: Optional[str]
+    weight: Optional[float]
+    width: Optional[float]
+    height: Optional[float]
+    depth: Optional[float]
+    warranty_info: Optional[str]
+    shipping_info: Optional[str]
+    availability_status: Optional[str]
+    return_policy: Optional[str]
+    minimum_order_quantity: Optional[int]
+    barcode: Optional[str]
+    qr_code_url: Optional[str]
+    thumbnail_url: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+
+# Normalized table row: users and products are slotted dataclasses, the rest dicts
+Row = Union[UserRow, ProductRow, Dict[str, Any]]
 
 
 class DataNormalizer:
@@ -18,6 +130,11 @@ class DataNormalizer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        self._raw_paths = {name: self.data_dir / f"{name}.json" for name in RAW_FILES}
+        self._out_paths = {
+            name: self.output_dir / f"{name}.json" for name in TABLE_NAMES
+        }
+
         # Counters for auto-generated IDs
         self.address_id = 1
         self.bank_id = 1
@@ -32,110 +149,184 @@ class DataNormalizer:
         self.category_cache = {}
         self.address_cache = {}
 
-    def normalize_all(self) -> Dict[str, List[Dict]]:
-        """Normalize all data and return tables"""
+    def normalize_all(self) -> Dict[str, int]:
+        """Normalize all data, save the tables and return their record counts"""
 
-        print("Normalizing all data...")
+        logger.info("Normalizing all data...")
 
-        # Load raw data
-        users_raw = self._load_json("users.json")
-        products_raw = self._load_json("products.json")
-        carts_raw = self._load_json("carts.json")
+        # One timestamp per run; worker processes receive it with the normalizer
+        self._now = datetime.now()
 
-        # Initialize tables
-        tables = {
-            "addresses": [],
-            "banks": [],
-            "companies": [],
-            "categories": [],
-            "users": [],
-            "products": [],
-            "product_tags": [],
-            "product_images": [],
-            "reviews": [],
-            "orders": [],
-            "order_items": [],
-        }
+        # Load raw data
+        users_raw = self._load_json("users")
+        products_raw = self._load_json("products")
+        carts_raw = self._load_json("carts")
+
+        # Record counts per table; the rows stay in the worker processes
+        counts = {name: 0 for name in TABLE_NAMES}
+
+        # Users, products and carts draw from disjoint ID counters, so the
+        # three phases run in separate processes and each one saves its own
+        # tables as soon as it finishes, overlapping writes with the others
+        batches = [
+            ("Users phase", "_normalize_users_batch", users_raw),
+            ("Products phase", "_normalize_products_batch", products_raw),
+            ("Carts phase", "_normalize_carts_batch", carts_raw),
+        ]
+        # Started with spawn since the pipeline runs this next to other threads
+        # (forking a multithreaded process copies their lock state)
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=len(batches), mp_context=spawn
+        ) as executor:
+            futures = [
+                (title, executor.submit(_normalize_batch, self, method, records))
+                for title, method, records in batches
+            ]
+            for title, future in futures:
+                stats = future.result()
+                counts.update(stats)
+
+                # Logged here: worker processes have no log listener thread
+                for name, count in stats.items():
+                    logger.info(f"  ✓ {self._out_paths[name]} ({count} records)")
+                log_stats(logger, title, stats)
+
+        logger.info("Normalization complete")
+
+        return counts
+
+    def _normalize_users_batch(self, users_raw: List[Dict]) -> Dict[str, List[Row]]:
+        """Normalize users (as UserRow) with their addresses, banks and companies"""
+
+        tables = {"addresses": [], "banks": [], "companies": [], "users": []}
 
         # Normalize users (includes addresses, banks, companies)
-        print("\n→ Normalizing users...")
+        normalize_user = self._normalize_user
+        add_address = tables["addresses"].append
+        add_bank = tables["banks"].append
+        add_company = tables["companies"].append
+        add_user = tables["users"].append
         for user in users_raw:
-            normalized = self._normalize_user(user)
+            normalized = normalize_user(user)
             if normalized["address"]:
-                tables["addresses"].append(normalized["address"])
+                add_address(normalized["address"])
             if normalized["bank"]:
-                tables["banks"].append(normalized["bank"])
+                add_bank(normalized["bank"])
             if normalized["company"]:
-                tables["companies"].append(normalized["company"])
+                add_company(normalized["company"])
                 if normalized["company_address"]:
-                    tables["addresses"].append(normalized["company_address"])
-            tables["users"].append(normalized["user"])
+                    add_address(normalized["company_address"])
+            add_user(normalized["user"])
+
+        return tables
 
-        print(f"  ✓ Users: {len(tables['users'])}")
-        print(f"  ✓ Addresses: {len(tables['addresses'])}")
-        print(f"  ✓ Banks: {len(tables['banks'])}")
-        print(f"  ✓ Companies: {len(tables['companies'])}")
+    def _normalize_products_batch(
+        self, products_raw: List[Dict]
+    ) -> Dict[str, List[Row]]:
+        """Normalize products (as ProductRow) with categories, tags, images, reviews"""
+
+        tables = {
+            "products": [],
+            "product_tags": [],
+            "product_images": [],
+            "reviews": [],
+        }
 
         # Normalize products (includes categories, tags, images, reviews)
-        print("\n→ Normalizing products...")
+        normalize_product = self._normalize_product
+        add_product = tables["products"].append
+        add_tags = tables["product_tags"].extend
+        add_images = tables["product_images"].extend
+        add_reviews = tables["reviews"].extend
+        tag_ids = count(self.product_tag_id)
+        image_ids = count(self.product_image_id)
+        review_ids = count(self.review_id)
         for product in products_raw:
-            normalized = self._normalize_product(product)
-            tables["products"].append(normalized["product"])
-            tables["product_tags"].extend(normalized["tags"])
-            tables["product_images"].extend(normalized["images"])
-            tables["reviews"].extend(normalized["reviews"])
+            product_id = product["id"]
+            add_product(normalize_product(product))
+            add_tags(
+                {"id": next(tag_ids), "product_id": product_id, "tag": tag}
+                for tag in product.get("tags", [])
+            )
+            add_images(
+                {
+                    "id": next(image_ids),
+                    "product_id": product_id,
+                    "image_url": img_url,
+                    "image_order": idx,
+                }
+                for idx, img_url in enumerate(product.get("images", []))
+            )
+            add_reviews(
+                {
+                    "id": next(review_ids),
+                    "product_id": product_id,
+                    "rating": review.get("rating"),
+                    "comment": review.get("comment"),
+                    "reviewer_name": review.get("reviewerName"),
+                    "reviewer_email": review.get("reviewerEmail"),
+                    "review_date": review.get("date"),
+                }
+                for review in product.get("reviews", [])
+            )
+        self.product_tag_id = next(tag_ids)
+        self.product_image_id = next(image_ids)
+        self.review_id = next(review_ids)
 
         tables["categories"] = list(self.category_cache.values())
 
-        print(f"  ✓ Products: {len(tables['products'])}")
-        print(f"  ✓ Categories: {len(tables['categories'])}")
-        print(f"  ✓ Product tags: {len(tables['product_tags'])}")
-        print(f"  ✓ Product images: {len(tables['product_images'])}")
-        print(f"  ✓ Reviews: {len(tables['reviews'])}")
+        return tables
 
-        # Normalize carts → orders
-        print("\n→ Normalizing carts to orders...")
-        for cart in carts_raw:
-            normalized = self._normalize_cart(cart)  # renamed method
-            tables["orders"].append(normalized["order"])
-            tables["order_items"].extend(normalized["items"])
+    def _normalize_carts_batch(self, carts_raw: List[Dict]) -> Dict[str, List[Row]]:
+        """Normalize carts into orders and order items"""
 
-        print(f"  ✓ Orders: {len(tables['orders'])}")
-        print(f"  ✓ Order items: {len(tables['order_items'])}")
+        tables = {"orders": [], "order_items": []}
 
-        # Save normalized data
-        self._save_normalized_data(tables)
+        # Normalize carts → orders
+        normalize_cart = self._normalize_cart
+        add_order = tables["orders"].append
+        add_items = tables["order_items"].extend
+        order_dates = self._pregenerate_order_dates(len(carts_raw))
+        statuses = _RNG.choice(_STATUSES, size=len(carts_raw)).tolist()
+        for cart, order_date, status in zip(carts_raw, order_dates, statuses):
+            normalized = normalize_cart(cart, order_date, status)
+            add_order(normalized["order"])
+            add_items(normalized["items"])
 
         return tables
 
     def _normalize_user(self, user: Dict) -> Dict:
         """Normalize user and extract related entities"""
 
+        get = user.get
+        next_address_id = self.address_id
+
         # Extract address
         address = None
         address_id = None
-        if user.get("address"):
-            addr = user["address"]
-            coords = addr.get("coordinates", {})
+        addr = get("address")
+        if addr:
+            coords = addr.get("coordinates") or EMPTY_DICT
             address = {
-                "id": self.address_id,
+                "id": next_address_id,
                 "address_line": addr.get("address", ""),
                 "city": addr.get("city", ""),
-                "state": addr.get("state", ""),
+                "state": _intern(addr.get("state", "")),
                 "state_code": addr.get("stateCode", ""),
                 "postal_code": addr.get("postalCode", ""),
-                "country": addr.get("country", "United States"),
+                "country": _intern(addr.get("country", "United States")),
                 "latitude": coords.get("lat"),
                 "longitude": coords.get("lng"),
             }
-            address_id = self.address_id
-            self.address_id += 1
+            address_id = next_address_id
+            next_address_id += 1
 
         # Extract bank
         bank = None
         bank_id = None
-        if user.get("bank"):
-            b = user["bank"]
+        b = get("bank")
+        if b:
             bank = {
                 "id": self.bank_id,
                 "card_number": b.get("cardNumber"),
@@ -151,27 +342,26 @@ class DataNormalizer:
         company = None
         company_address = None
         company_id = None
-        if user.get("company"):
-            comp = user["company"]
-
+        comp = get("company")
+        if comp:
             # Company address
             comp_addr_id = None
-            if comp.get("address"):
-                ca = comp["address"]
-                coords = ca.get("coordinates", {})
+            ca = comp.get("address")
+            if ca:
+                coords = ca.get("coordinates") or EMPTY_DICT
                 company_address = {
-                    "id": self.address_id,
+                    "id": next_address_id,
                     "address_line": ca.get("address", ""),
                     "city": ca.get("city", ""),
-                    "state": ca.get("state", ""),
+                    "state": _intern(ca.get("state", "")),
                     "state_code": ca.get("stateCode", ""),
                     "postal_code": ca.get("postalCode", ""),
-                    "country": ca.get("country", "United States"),
+                    "country": _intern(ca.get("country", "United States")),
                     "latitude": coords.get("lat"),
                     "longitude": coords.get("lng"),
                 }
-                comp_addr_id = self.address_id
-                self.address_id += 1
+                comp_addr_id = next_address_id
+                next_address_id += 1
 
             company = {
                 "id": self.company_id,
@@ -183,43 +373,46 @@ class DataNormalizer:
             company_id = self.company_id
             self.company_id += 1
 
-        # Extract hair
-        hair = user.get("hair", {})
+        self.address_id = next_address_id
+
+        # Extract hair and crypto
+        hair = get("hair") or EMPTY_DICT
+        crypto = get("crypto") or EMPTY_DICT
 
         # Main user record
-        user_normalized = {
-            "id": user["id"],
-            "first_name": user.get("firstName"),
-            "last_name": user.get("lastName"),
-            "maiden_name": user.get("maidenName"),
-            "age": user.get("age"),
-            "gender": user.get("gender"),
-            "email": user.get("email"),
-            "phone": user.get("phone"),
-            "username": user.get("username"),
-            "password": user.get("password"),
-            "birth_date": user.get("birthDate"),
-            "image_url": user.get("image"),
-            "blood_group": user.get("bloodGroup"),
-            "height": user.get("height"),
-            "weight": user.get("weight"),
-            "eye_color": user.get("eyeColor"),
-            "hair_color": hair.get("color"),
-            "hair_type": hair.get("type"),
-            "ip_address": user.get("ip"),
-            "mac_address": user.get("macAddress"),
-            "user_agent": user.get("userAgent"),
-            "university": user.get("university"),
-            "ein": user.get("ein"),
-            "ssn": user.get("ssn"),
-            "role": user.get("role", "user"),
-            "crypto_coin": user.get("crypto", {}).get("coin"),
-            "crypto_wallet": user.get("crypto", {}).get("wallet"),
-            "crypto_network": user.get("crypto", {}).get("network"),
-            "bank_id": bank_id,
-            "company_id": company_id,
-            "address_id": address_id,
-        }
+        user_normalized = UserRow(
+            id=user["id"],
+            first_name=get("firstName"),
+            last_name=get("lastName"),
+            maiden_name=get("maidenName"),
+            age=get("age"),
+            gender=get("gender"),
+            email=get("email"),
+            phone=get("phone"),
+            username=get("username"),
+            password=get("password"),
+            birth_date=get("birthDate"),
+            image_url=get("image"),
+            blood_group=get("bloodGroup"),
+            height=get("height"),
+            weight=get("weight"),
+            eye_color=get("eyeColor"),
+            hair_color=hair.get("color"),
+            hair_type=hair.get("type"),
+            ip_address=get("ip"),
+            mac_address=get("macAddress"),
+            user_agent=get("userAgent"),
+            university=get("university"),
+            ein=get("ein"),
+            ssn=get("ssn"),
+            role=_intern(get("role", "user")),
+            crypto_coin=crypto.get("coin"),
+            crypto_wallet=crypto.get("wallet"),
+            crypto_network=crypto.get("network"),
+            bank_id=bank_id,
+            company_id=company_id,
+            address_id=address_id,
+        )
 
         return {
             "user": user_normalized,
@@ -229,12 +422,13 @@ class DataNormalizer:
             "company_address": company_address,
         }
 
-    def _normalize_product(self, product: Dict) -> Dict:
-        """Normalize product and extract related entities"""
+    def _normalize_product(self, product: Dict) -> ProductRow:
+        """Normalize product row and resolve its category"""
 
         # Get or create category
-        category_name = product.get("category", "uncategorized")
-        category_slug = category_name.lower().replace(" ", "-")
+        get = product.get
+        category_name = _intern(get("category", "uncategorized"))
+        category_slug = sys.intern(category_name.translate(_SLUG_TRANS))
 
         if category_slug not in self.category_cache:
             self.category_cache[category_slug] = {
@@ -248,164 +442,133 @@ class DataNormalizer:
             category_id = self.category_cache[category_slug]["id"]
 
         # Dimensions
-        dims = product.get("dimensions", {})
+        dims = get("dimensions") or EMPTY_DICT
 
         # Meta
-        meta = product.get("meta", {})
+        meta = get("meta") or EMPTY_DICT
 
         # Main product
-        product_normalized = {
-            "id": product["id"],
-            "title": product.get("title"),
-            "description": product.get("description"),
-            "category_id": category_id,
-            "price": product.get("price"),
-            "discount_percentage": product.get("discountPercentage"),
-            "rating": product.get("rating"),
-            "stock": product.get("stock"),
-            "brand": product.get("brand"),
-            "sku": product.get("sku"),
-            "weight": product.get("weight"),
-            "width": dims.get("width"),
-            "height": dims.get("height"),
-            "depth": dims.get("depth"),
-            "warranty_info": product.get("warrantyInformation"),
-            "shipping_info": product.get("shippingInformation"),
-            "availability_status": product.get("availabilityStatus"),
-            "return_policy": product.get("returnPolicy"),
-            "minimum_order_quantity": product.get("minimumOrderQuantity"),
-            "barcode": meta.get("barcode"),
-            "qr_code_url": meta.get("qrCode"),
-            "thumbnail_url": product.get("thumbnail"),
-            "created_at": meta.get("createdAt"),
-            "updated_at": meta.get("updatedAt"),
-        }
-
-        # Tags
-        tags = []
-        for tag in product.get("tags", []):
-            tags.append(
-                {"id": self.product_tag_id, "product_id": product["id"], "tag": tag}
-            )
-            self.product_tag_id += 1
-
-        # Images
-        images = []
-        for idx, img_url in enumerate(product.get("images", [])):
-            images.append(
-                {
-                    "id": self.product_image_id,
-                    "product_id": product["id"],
-                    "image_url": img_url,
-                    "image_order": idx,
-                }
-            )
-            self.product_image_id += 1
-
-        # Reviews
-        reviews = []
-        for review in product.get("reviews", []):
-            reviews.append(
-                {
-                    "id": self.review_id,
-                    "product_id": product["id"],
-                    "rating": review.get("rating"),
-                    "comment": review.get("comment"),
-                    "reviewer_name": review.get("reviewerName"),
-                    "reviewer_email": review.get("reviewerEmail"),
-                    "review_date": review.get("date"),
-                }
-            )
-            self.review_id += 1
-
-        return {
-            "product": product_normalized,
-            "tags": tags,
-            "images": images,
-            "reviews": reviews,
-        }
-
-    def _normalize_cart(self, cart: Dict) -> Dict:
-        """Normalize cart → order and add timestamp"""
-
-        order_date = self._generate_order_date(cart.get("userId"))
+        product_normalized = ProductRow(
+            id=product["id"],
+            title=get("title"),
+            description=get("description"),
+            category_id=category_id,
+            price=get("price"),
+            discount_percentage=get("discountPercentage"),
+            rating=get("rating"),
+            stock=get("stock"),
+            brand=get("brand"),
+            sku=get("sku"),
+            weight=get("weight"),
+            width=dims.get("width"),
+            height=dims.get("height"),
+            depth=dims.get("depth"),
+            warranty_info=get("warrantyInformation"),
+            shipping_info=get("shippingInformation"),
+            availability_status=get("availabilityStatus"),
+            return_policy=get("returnPolicy"),
+            minimum_order_quantity=get("minimumOrderQuantity"),
+            barcode=meta.get("barcode"),
+            qr_code_url=meta.get("qrCode"),
+            thumbnail_url=get("thumbnail"),
+            created_at=meta.get("createdAt"),
+            updated_at=meta.get("updatedAt"),
+        )
+
+        return product_normalized
+
+    def _normalize_cart(self, cart: Dict, order_date: str, status: str) -> Dict:
+        """Normalize cart → order with a pre-generated timestamp and status"""
+
+        get = cart.get
+        order_id = cart["id"]
 
         order_normalized = {
-            "id": cart["id"],
-            "user_id": cart.get("userId"),
-            "total": cart.get("total"),
+            "id": order_id,
+            "user_id": get("userId"),
+            "total": get("total"),
             "order_date": order_date,
-            "status": random.choice(["completed", "pending", "shipped", "delivered"]),
-            "discounted_total": cart.get("discountedTotal"),
-            "total_products": cart.get("totalProducts"),
-            "total_quantity": cart.get("totalQuantity"),
+            "status": status,
+            "discounted_total": get("discountedTotal"),
+            "total_products": get("totalProducts"),
+            "total_quantity": get("totalQuantity"),
         }
 
         # Order items
         items = []
-        for product in cart.get("products", []):
+        for product in get("products", []):
+            pget = product.get
             items.append(
                 {
                     "id": self.order_item_id,
-                    "order_id": cart["id"],
-                    "product_id": product.get("id"),
-                    "quantity": product.get("quantity"),
-                    "price": product.get("price"),
-                    "discount_percentage": product.get("discountPercentage"),
-                    "discounted_total": product.get("discountedTotal"),
-                    "total": product.get("total"),
+                    "order_id": order_id,
+                    "product_id": pget("id"),
+                    "quantity": pget("quantity"),
+                    "price": pget("price"),
+                    "discount_percentage": pget("discountPercentage"),
+                    "discounted_total": pget("discountedTotal"),
+                    "total": pget("total"),
                 }
             )
             self.order_item_id += 1
 
         return {"order": order_normalized, "items": items}
 
-    def _load_json(self, filename: str) -> List[Dict]:
+    def _load_json(self, name: str) -> List[Dict]:
         """Load json file"""
 
-        with open(self.data_dir / filename, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(self._raw_paths[name].read_bytes())
 
-    def _save_normalized_data(self, tables: Dict[str, List[Dict]]) -> None:
+    def _save_normalized_data(self, tables: Dict[str, List[Row]]) -> None:
         """Save normalized tables to JSON files"""
 
-        print("\n→ Saving normalized data...")
+        # File writes release the GIL, so tables are written in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(self._write_table, tables.keys(), tables.values()))
 
-        for table_name, records in tables.items():
-            output_file = self.output_dir / f"{table_name}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(records, f, indent=2, ensure_ascii=False)
-            print(f"  ✓ {output_file} ({len(records)} records)")
+    def _write_table(self, table_name: str, records: List[Row]) -> None:
+        """Write one normalized table to its JSON file"""
 
-        print(" Normalization complete")
+        output_file = self._out_paths[table_name]
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
 
-    def _generate_order_date(self, user_id: int) -> str:
+    def _pregenerate_order_dates(self, n: int) -> List[str]:
         """
-        Generate realistic order date
-        Distributed over last 12 months
+        Generate n realistic order dates
+        Distributed over last 12 months, business hours 9-21
         """
-        days_ago = random.randint(0, 365)
-        order_date = datetime.now() - timedelta(days=days_ago)
+        now = self._now
+        days_ago = _RNG.integers(0, 366, n).tolist()
+        hours = _RNG.integers(9, 22, n).tolist()
+        minutes = _RNG.integers(0, 60, n).tolist()
+        seconds = _RNG.integers(0, 60, n).tolist()
 
-        # Add random time (business hours 9-21)
-        hour = random.randint(9, 21)
-        minute = random.randint(0, 59)
-        second = random.randint(0, 59)
+        return [
+            (now - timedelta(days=d)).replace(hour=h, minute=m, second=sec).isoformat()
+            for d, h, m, sec in zip(days_ago, hours, minutes, seconds)
+        ]
 
-        order_date = order_date.replace(hour=hour, minute=minute, second=second)
 
-        return order_date.isoformat()
+def _normalize_batch(
+    normalizer: DataNormalizer, method: str, records: List[Dict]
+) -> Dict[str, int]:
+    """Run one normalization phase in a worker, save its tables, return counts"""
+    tables = getattr(normalizer, method)(records)
+    normalizer._save_normalized_data(tables)
+    # Only the counts go back to the parent, not the pickled rows
+    return {name: len(rows) for name, rows in tables.items()}
 
 
 def main():
     """Test normalization"""
     normalizer = DataNormalizer(output_dir=PROCESSED_DIR, data_dir=RAW_DIR)
-    tables = normalizer.normalize_all()
+    counts = normalizer.normalize_all()
 
     # Print summary
     print("\n Summary:")
-    for table, records in tables.items():
-        print(f"  • {table}: {len(records)} records")
+    for table, count in counts.items():
+        print(f"  • {table}: {count} records")
 
 
 if __name__ == "__main__":
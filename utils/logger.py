@@ -2,7 +2,10 @@
 Centralized logging configuration for ETL pipeline
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from configs.config import LOGS_DIR
@@ -20,10 +23,22 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
+        }
+
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Restore the plain levelname so other handlers see an unmodified record
+        levelname = record.levelname
+        record.levelname = self._colored.get(
+            levelname, f"{self.RESET}{levelname}{self.RESET}"
+        )
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logger(name: str, log_file: str = None, level=logging.INFO):
@@ -48,7 +63,7 @@ def setup_logger(name: str, log_file: str = None, level=logging.INFO):
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if log_file provided)
     if log_file:
@@ -56,7 +71,17 @@ def setup_logger(name: str, log_file: str = None, level=logging.INFO):
         file_handler = logging.FileHandler(log_path, mode="a", encoding="utf-8")
         file_handler.setLevel(level)
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Handlers run on a background listener thread; callers only enqueue
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
     return logger
 
@@ -99,9 +124,8 @@ def log_performance(logger, operation: str, duration: float, records: int = None
 
 
 def log_stats(logger, title: str, stats: dict):
-    """Log statistics in formatted way"""
-    logger.info(f"\n{title}")
-    logger.info("-" * 60)
-    for key, value in stats.items():
-        logger.info(f"  • {key:30s}: {value}")
-    logger.info("-" * 60)
+    """Log statistics in formatted way (as a single record)"""
+    lines = [f"\n{title}", "-" * 60]
+    lines.extend(f"  • {key:30s}: {value}" for key, value in stats.items())
+    lines.append("-" * 60)
+    logger.info("\n".join(lines))
@@ -3,24 +3,150 @@ Data validation module for ETL pipeline
 Validates data integrity, referential integrity, and data quality
 """
 
-import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import chain, islice
+from operator import itemgetter
+import ijson
+import numpy as np
+import orjson
+import pandas as pd
 import psycopg2
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Iterable, Iterator, Optional, Tuple
 from collections import defaultdict
-from configs.config import DatabaseConfig, PROCESSED_DIR
+from configs.config import DatabaseConfig, PROCESSED_DIR, RESULTS_DIR
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__, "validation.log")
 
+# Id and foreign key columns kept from the first pass for the FK checks
+FK_COLUMNS = {
+    "users.json": ("id", "address_id"),
+    "products.json": ("id", "category_id"),
+    "orders.json": ("id", "user_id"),
+    "order_items.json": ("id", "order_id", "product_id"),
+    "addresses.json": ("id",),
+    "categories.json": ("id",),
+}
+
+# Required fields per file, in the order their messages are reported
+_REQ_USERS = ("id", "email", "username")
+_REQ_ORDERS = ("id", "user_id")
+_REQ_ORDER_ITEMS = ("order_id", "product_id", "quantity")
+
+# Plausible value ranges: age is exclusive, rating inclusive
+_AGE_MIN, _AGE_MAX = 0, 120
+_RATING_MIN, _RATING_MAX = 0, 5
+
+# Post-load data quality checks: (table, condition, label, kind).
+# "null" and "error" rows fail validation, "warning" rows are only logged;
+# falsy values are skipped like in the file checks
+DB_QUALITY_CHECKS = [
+    ("users", "email IS NULL", "users with NULL email", "null"),
+    ("users", "username IS NULL", "users with NULL username", "null"),
+    (
+        "users",
+        "email <> '' AND email NOT LIKE '%@%'",
+        "users with invalid email",
+        "warning",
+    ),
+    (
+        "users",
+        f"age <> 0 AND NOT (age > {_AGE_MIN} AND age < {_AGE_MAX})",
+        "users with suspicious age",
+        "warning",
+    ),
+    ("products", "price < 0", "products with negative price", "error"),
+    ("products", "stock < 0", "products with negative stock", "warning"),
+    (
+        "products",
+        f"rating NOT BETWEEN {_RATING_MIN} AND {_RATING_MAX}",
+        "products with rating out of range",
+        "warning",
+    ),
+    ("orders", "total < 0", "orders with negative total", "error"),
+    ("order_items", "quantity < 0", "order items with invalid quantity", "error"),
+]
+
+# Messages stored per file and kind; further ones are only counted
+MAX_MESSAGES_PER_FILE = 1000
+# Messages written to the NDJSON report per file and kind
+MAX_REPORTED_PER_FILE = 100_000
+
+# Files below this size are parsed in one go with orjson, larger ones streamed
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Rows fetched per round-trip when streaming DB foreign key violations
+FK_REPORT_BATCH_SIZE = 10_000
+
+# Files at least this large are validated in worker processes, smaller ones
+# in-process (cheaper than starting a worker for them)
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+# Records per DataFrame chunk for the vectorized per-file checks
+VALIDATION_CHUNK_SIZE = 50_000
+
+
+def _frames(
+    records: Iterable[Dict], columns: Tuple[str, ...]
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """Yield (offset, DataFrame) chunks of the checked columns from a record stream"""
+    records = iter(records)
+    offset = 0
+    while True:
+        chunk = list(islice(records, VALIDATION_CHUNK_SIZE))
+        if not chunk:
+            return
+        # object dtype keeps the original values (int stays int, None stays None)
+        yield offset, pd.DataFrame(chunk, columns=list(columns), dtype=object)
+        offset += len(chunk)
+
+
+def _picker(columns: Tuple[str, ...]) -> Callable[[Dict], Tuple]:
+    """Build a function returning a record's values for columns (NaN when missing)"""
+    get = itemgetter(*columns)
+    single = len(columns) == 1
+
+    def pick(record: Dict) -> Tuple:
+        try:
+            values = get(record)
+        except KeyError:
+            # Same as a missing dict key in a DataFrame: NaN, not None
+            return tuple(record.get(c, np.nan) for c in columns)
+        return (values,) if single else values
+
+    return pick
+
+
+def _absent(column: pd.Series) -> np.ndarray:
+    """Rows where the key is missing (explicit nulls are present)"""
+    return column.isna().to_numpy() & (column.to_numpy() != None)  # noqa: E711
+
+
+def _falsy(column: pd.Series) -> np.ndarray:
+    """Rows whose value is falsy: missing, null, empty string or zero"""
+    values = column.to_numpy()
+    return column.isna().to_numpy() | (values == "") | (values == 0)
+
 
 class DataValidator:
     """Validates data quality and integrity"""
 
-    def __init__(self, data_dir: str = PROCESSED_DIR):
+    def __init__(
+        self, data_dir: str = PROCESSED_DIR, report_path: Optional[Path] = None
+    ):
         self.data_dir = Path(data_dir)
+        # Optional NDJSON file receiving messages past the storage cap as well
+        self.report_path = Path(report_path) if report_path else None
         self.errors = defaultdict(list)
         self.warnings = defaultdict(list)
+        # Message totals per file, including the ones past the storage cap
+        self.counts = {"errors": defaultdict(int), "warnings": defaultdict(int)}
+        self._fk_frames: Dict[str, pd.DataFrame] = {}
 
     def validate_all_files(self) -> Dict[str, Any]:
         """Validate all normalized JSON files"""
@@ -51,25 +177,59 @@ class DataValidator:
             "order_items.json",
         ]
 
+        if self.report_path:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            self.report_path.write_bytes(b"")
+
+        args = []
         for filename in files_to_check:
             filepath = self.data_dir / filename
 
             if not filepath.exists():
-                self.errors[filename].append(f"File not found: {filepath}")
+                self._add("errors", filename, f"File not found: {filepath}")
                 continue
 
-            try:
-                data = self._load_json(filepath)
-                results["files_checked"] += 1
-                results["total_records"] += len(data)
-
-                self._validate_file(filename, data)
-
-                logger.info(f"✓ {filename}: {len(data)} records validated")
+            args.append((filename, filepath, self.report_path))
+
+        # Files are independent: large ones get their own worker process,
+        # started with spawn since main() runs this next to other threads
+        # (forking a multithreaded process copies their lock state)
+        large = [a for a in args if a[1].stat().st_size >= PARALLEL_MIN_BYTES]
+        small = [a for a in args if a[1].stat().st_size < PARALLEL_MIN_BYTES]
+        num_proc = min(len(large), os.cpu_count() or 1)
+        spawn = multiprocessing.get_context("spawn")
+        with spawn.Pool(num_proc) if large else nullcontext() as pool:
+            # imap_unordered dispatches right away, so the workers run on the
+            # large files while the small ones are validated here
+            outcomes = chain(
+                map(_validate_one_file, small),
+                pool.imap_unordered(_validate_one_file, large) if large else (),
+            )
+            for (
+                filename,
+                record_count,
+                errors,
+                warnings,
+                counts,
+                failure,
+                fk_frame,
+            ) in outcomes:
+                if fk_frame is not None:
+                    self._fk_frames[filename] = fk_frame
+                if errors:
+                    self.errors[filename].extend(errors)
+                    self.counts["errors"][filename] += counts[0]
+                if warnings:
+                    self.warnings[filename].extend(warnings)
+                    self.counts["warnings"][filename] += counts[1]
+
+                if failure:
+                    logger.error(f"✗ {filename}: {failure}")
+                    continue
 
-            except Exception as e:
-                self.errors[filename].append(f"Error reading file: {str(e)}")
-                logger.error(f"✗ {filename}: {str(e)}")
+                results["files_checked"] += 1
+                results["total_records"] += record_count
+                logger.info(f"✓ {filename}: {record_count} records validated")
 
         # Check referential integrity
         self._validate_referential_integrity()
@@ -77,6 +237,8 @@ class DataValidator:
         # Compile results
         results["errors"] = dict(self.errors)
         results["warnings"] = dict(self.warnings)
+        results["error_counts"] = dict(self.counts["errors"])
+        results["warning_counts"] = dict(self.counts["warnings"])
         results["passed"] = len(self.errors) == 0
 
         # Print summary
@@ -84,204 +246,372 @@ class DataValidator:
 
         return results
 
-    def _validate_file(self, filename: str, data: List[Dict]) -> None:
-        """Validate specific file"""
+    def _validate_file(self, filename: str, data: Iterable[Dict]) -> int:
+        """Validate specific file, return number of records"""
 
-        if not data:
-            self.warnings[filename].append("File is empty")
-            return
+        record_count = 0
+        fk_columns = FK_COLUMNS.get(filename)
+        fk_rows = []
+        pick_fk = _picker(fk_columns) if fk_columns else None
+
+        def counted() -> Iterator[Dict]:
+            nonlocal record_count
+            for record in data:
+                record_count += 1
+                if pick_fk:
+                    fk_rows.append(pick_fk(record))
+                yield record
+
+        records = counted()
 
         # Check for required fields based on table
         if filename == "users.json":
-            self._validate_users(data)
+            self._validate_users(records)
         elif filename == "products.json":
-            self._validate_products(data)
+            self._validate_products(records)
         elif filename == "orders.json":
-            self._validate_orders(data)
+            self._validate_orders(records)
         elif filename == "order_items.json":
-            self._validate_order_items(data)
+            self._validate_order_items(records)
         elif filename == "addresses.json":
-            self._validate_addresses(data)
-
-    def _validate_users(self, users: List[Dict]) -> None:
-        """Validate users data"""
+            self._validate_addresses(records)
+        else:
+            for _ in records:
+                pass
 
-        required_fields = ["id", "email", "username"]
+        if not record_count:
+            self._add("warnings", filename, "File is empty")
 
-        for idx, user in enumerate(users):
-            # Check required fields
-            for field in required_fields:
-                if field not in user or user[field] is None:
-                    self.errors["users.json"].append(
-                        f"Record {idx}: Missing required field '{field}'"
-                    )
+        if fk_columns:
+            self._fk_frames[filename] = pd.DataFrame(
+                fk_rows, columns=list(fk_columns), dtype=object
+            )
 
-            # Validate email format
-            if "email" in user and user["email"]:
-                if "@" not in user["email"]:
-                    self.warnings["users.json"].append(
-                        f"Record {idx}: Invalid email format: {user['email']}"
-                    )
+        return record_count
 
-            # Check age range
-            if "age" in user and user["age"]:
-                if not (0 < user["age"] < 120):
-                    self.warnings["users.json"].append(
-                        f"Record {idx}: Suspicious age value: {user['age']}"
-                    )
+    def _validate_users(self, users: Iterable[Dict]) -> None:
+        """Validate users data"""
 
-    def _validate_products(self, products: List[Dict]) -> None:
-        """Validate products data"""
+        for offset, df in _frames(users, _REQ_USERS + ("age",)):
+            email = df["email"]
+            age = df["age"]
+            age_num = pd.to_numeric(age, errors="coerce")
 
-        for idx, product in enumerate(products):
-            # Check required fields
-            if "id" not in product:
-                self.errors["products.json"].append(f"Record {idx}: Missing 'id'")
+            errors = [
+                (
+                    df[field].isna().to_numpy(),
+                    f"Record {{idx}}: Missing required field '{field}'",
+                    None,
+                )
+                for field in _REQ_USERS
+            ]
+            warnings = [
+                (
+                    ~_falsy(email)
+                    & ~email.astype(str).str.contains("@", regex=False).to_numpy(),
+                    "Record {idx}: Invalid email format: {value}",
+                    email.to_numpy(),
+                ),
+                (
+                    ~_falsy(age)
+                    & ~((age_num > _AGE_MIN) & (age_num < _AGE_MAX)).to_numpy(),
+                    "Record {idx}: Suspicious age value: {value}",
+                    age.to_numpy(),
+                ),
+            ]
+            self._report("errors", "users.json", offset, errors)
+            self._report("warnings", "users.json", offset, warnings)
 
-            if "title" not in product or not product["title"]:
-                self.errors["products.json"].append(f"Record {idx}: Missing 'title'")
+    def _validate_products(self, products: Iterable[Dict]) -> None:
+        """Validate products data"""
 
-            # Validate price
-            if "price" in product and product["price"]:
-                if product["price"] < 0:
-                    self.errors["products.json"].append(
-                        f"Record {idx}: Negative price: {product['price']}"
-                    )
+        columns = ("id", "title", "price", "stock", "rating")
+        for offset, df in _frames(products, columns):
+            price, stock, rating = df["price"], df["stock"], df["rating"]
+            price_num = pd.to_numeric(price, errors="coerce")
+            stock_num = pd.to_numeric(stock, errors="coerce")
+            rating_num = pd.to_numeric(rating, errors="coerce")
+
+            errors = [
+                (_absent(df["id"]), "Record {idx}: Missing 'id'", None),
+                (_falsy(df["title"]), "Record {idx}: Missing 'title'", None),
+                (
+                    ~_falsy(price) & (price_num < 0).to_numpy(),
+                    "Record {idx}: Negative price: {value}",
+                    price.to_numpy(),
+                ),
+            ]
+            warnings = [
+                (
+                    ~_falsy(stock) & (stock_num < 0).to_numpy(),
+                    "Record {idx}: Negative stock: {value}",
+                    stock.to_numpy(),
+                ),
+                (
+                    ~_falsy(rating)
+                    & ~rating_num.between(_RATING_MIN, _RATING_MAX).to_numpy(),
+                    "Record {idx}: Rating out of range: {value}",
+                    rating.to_numpy(),
+                ),
+            ]
+            self._report("errors", "products.json", offset, errors)
+            self._report("warnings", "products.json", offset, warnings)
 
-            # Validate stock
-            if "stock" in product and product["stock"]:
-                if product["stock"] < 0:
-                    self.warnings["products.json"].append(
-                        f"Record {idx}: Negative stock: {product['stock']}"
-                    )
+    def _validate_orders(self, orders: Iterable[Dict]) -> None:
+        """Validate orders data"""
 
-            # Validate rating
-            if "rating" in product and product["rating"]:
-                if not (0 <= product["rating"] <= 5):
-                    self.warnings["products.json"].append(
-                        f"Record {idx}: Rating out of range: {product['rating']}"
-                    )
+        for offset, df in _frames(orders, _REQ_ORDERS + ("total",)):
+            total = df["total"]
+            total_num = pd.to_numeric(total, errors="coerce")
 
-    def _validate_orders(self, orders: List[Dict]) -> None:
-        """Validate orders data"""
-        for idx, order in enumerate(orders):
-            # Check required fields
-            if "id" not in order:
-                self.errors["orders.json"].append(f"Record {idx}: Missing 'id'")
-
-            if "user_id" not in order:
-                self.errors["orders.json"].append(f"Record {idx}: Missing 'user_id'")
-
-            # Validate total
-            if "total" in order and order["total"]:
-                if order["total"] < 0:
-                    self.errors["orders.json"].append(
-                        f"Record {idx}: Negative total: {order['total']}"
-                    )
+            errors = [
+                (_absent(df[field]), f"Record {{idx}}: Missing '{field}'", None)
+                for field in _REQ_ORDERS
+            ]
+            errors.append(
+                (
+                    ~_falsy(total) & (total_num < 0).to_numpy(),
+                    "Record {idx}: Negative total: {value}",
+                    total.to_numpy(),
+                )
+            )
+            self._report("errors", "orders.json", offset, errors)
 
-    def _validate_order_items(self, items: List[Dict]) -> None:
+    def _validate_order_items(self, items: Iterable[Dict]) -> None:
         """Validate order items"""
-        for idx, item in enumerate(items):
-            # Check required fields
-            required = ["order_id", "product_id", "quantity"]
-            for field in required:
-                if field not in item:
-                    self.errors["order_items.json"].append(
-                        f"Record {idx}: Missing '{field}'"
-                    )
 
-            # Validate quantity
-            if "quantity" in item and item["quantity"]:
-                if item["quantity"] <= 0:
-                    self.errors["order_items.json"].append(
-                        f"Record {idx}: Invalid quantity: {item['quantity']}"
-                    )
+        for offset, df in _frames(items, _REQ_ORDER_ITEMS):
+            quantity = df["quantity"]
+            quantity_num = pd.to_numeric(quantity, errors="coerce")
 
-    def _validate_addresses(self, addresses: List[Dict]) -> None:
+            errors = [
+                (_absent(df[field]), f"Record {{idx}}: Missing '{field}'", None)
+                for field in _REQ_ORDER_ITEMS
+            ]
+            errors.append(
+                (
+                    ~_falsy(quantity) & (quantity_num <= 0).to_numpy(),
+                    "Record {idx}: Invalid quantity: {value}",
+                    quantity.to_numpy(),
+                )
+            )
+            self._report("errors", "order_items.json", offset, errors)
+
+    def _validate_addresses(self, addresses: Iterable[Dict]) -> None:
         """Validate addresses"""
-        for idx, addr in enumerate(addresses):
-            if "id" not in addr:
-                self.errors["addresses.json"].append(f"Record {idx}: Missing 'id'")
 
+        for offset, df in _frames(addresses, ("id", "city", "state")):
+            errors = [(_absent(df["id"]), "Record {idx}: Missing 'id'", None)]
             # Check for at least city or state
-            if not addr.get("city") and not addr.get("state"):
-                self.warnings["addresses.json"].append(
-                    f"Record {idx}: Missing both city and state"
+            warnings = [
+                (
+                    _falsy(df["city"]) & _falsy(df["state"]),
+                    "Record {idx}: Missing both city and state",
+                    None,
                 )
+            ]
+            self._report("errors", "addresses.json", offset, errors)
+            self._report("warnings", "addresses.json", offset, warnings)
+
+    def _add(self, kind: str, filename: str, message: str) -> None:
+        """Record one error/warning message (stored and reported up to the caps)"""
+        self.counts[kind][filename] += 1
+        messages = getattr(self, kind)[filename]
+        if len(messages) < MAX_MESSAGES_PER_FILE:
+            messages.append(message)
+        if self.counts[kind][filename] <= MAX_REPORTED_PER_FILE:
+            self._write_report(kind, filename, [message])
+
+    def _write_report(self, kind: str, filename: str, messages: List[str]) -> None:
+        """Append messages to the NDJSON report, if one is configured"""
+        if not self.report_path:
+            return
+        level = "error" if kind == "errors" else "warning"
+        lines = b"".join(
+            orjson.dumps({"file": filename, "level": level, "message": m}) + b"\n"
+            for m in messages
+        )
+        # One unbuffered append per batch, so worker processes don't interleave lines
+        with open(self.report_path, "ab", buffering=0) as f:
+            f.write(lines)
+
+    def _report(
+        self,
+        kind: str,
+        filename: str,
+        offset: int,
+        checks: List[Tuple[np.ndarray, str, Optional[np.ndarray]]],
+        ids: Optional[np.ndarray] = None,
+    ) -> None:
+        """Record messages for flagged rows in record order"""
+
+        # Per record, messages keep the order in which the checks are listed
+        flagged = sorted(
+            (row, order)
+            for order, (mask, _, _) in enumerate(checks)
+            for row in np.flatnonzero(mask).tolist()
+        )
+        if not flagged:
+            return
+
+        # Only the messages that are kept or reported get formatted, so the
+        # cost stays bounded however many rows are flagged
+        messages = getattr(self, kind)[filename]
+        room = max(MAX_MESSAGES_PER_FILE - len(messages), 0)
+        report_room = 0
+        if self.report_path:
+            report_room = max(MAX_REPORTED_PER_FILE - self.counts[kind][filename], 0)
+        self.counts[kind][filename] += len(flagged)
+
+        formatted = [
+            checks[order][1].format(
+                idx=offset + row,
+                id=None if ids is None else ids[row],
+                value=None if checks[order][2] is None else checks[order][2][row],
+            )
+            for row, order in flagged[: max(room, report_room)]
+        ]
+        messages.extend(formatted[:room])
+        if report_room:
+            self._write_report(kind, filename, formatted[:report_room])
 
     def _validate_referential_integrity(self) -> None:
         """Check foreign key relationships"""
         logger.info("\n→ Validating referential integrity...")
 
         try:
-            # Load all data
-            users = self._load_json(self.data_dir / "users.json")
-            products = self._load_json(self.data_dir / "products.json")
-            orders = self._load_json(self.data_dir / "orders.json")
-            order_items = self._load_json(self.data_dir / "order_items.json")
-            addresses = self._load_json(self.data_dir / "addresses.json")
-            categories = self._load_json(self.data_dir / "categories.json")
-
-            # Build ID sets
-            user_ids = {u["id"] for u in users}
-            product_ids = {p["id"] for p in products}
-            order_ids = {o["id"] for o in orders}
-            address_ids = {a["id"] for a in addresses}
-            category_ids = {c["id"] for c in categories}
-
-            # Check orders -> users
-            for order in orders:
-                if order.get("user_id") and order["user_id"] not in user_ids:
-                    self.errors["referential_integrity"].append(
-                        f"Order {order['id']}: user_id {order['user_id']} not found in users"
-                    )
-
-            # Check order_items -> orders
-            for item in order_items:
-                if item.get("order_id") and item["order_id"] not in order_ids:
-                    self.errors["referential_integrity"].append(
-                        f"Order item {item['id']}: order_id {item['order_id']} not found"
-                    )
-
-            # Check order_items -> products
-            for item in order_items:
-                if item.get("product_id") and item["product_id"] not in product_ids:
-                    self.errors["referential_integrity"].append(
-                        f"Order item {item['id']}: product_id {item['product_id']} not found"
-                    )
-
-            # Check users -> addresses
-            for user in users:
-                if user.get("address_id") and user["address_id"] not in address_ids:
-                    self.errors["referential_integrity"].append(
-                        f"User {user['id']}: address_id {user['address_id']} not found"
-                    )
+            # Load only the id and foreign key columns
+            users = self._columns("users.json", ("id", "address_id"))
+            products = self._columns("products.json", ("id", "category_id"))
+            orders = self._columns("orders.json", ("id", "user_id"))
+            order_items = self._columns(
+                "order_items.json", ("id", "order_id", "product_id")
+            )
+            addresses = self._columns("addresses.json", ("id",))
+            categories = self._columns("categories.json", ("id",))
+
+            # child rows -> [(FK column, parent ids, message)]
+            relations = [
+                (
+                    orders,
+                    [
+                        (
+                            "user_id",
+                            users["id"],
+                            "Order {id}: user_id {value} not found in users",
+                        )
+                    ],
+                ),
+                (
+                    order_items,
+                    [
+                        (
+                            "order_id",
+                            orders["id"],
+                            "Order item {id}: order_id {value} not found",
+                        ),
+                        (
+                            "product_id",
+                            products["id"],
+                            "Order item {id}: product_id {value} not found",
+                        ),
+                    ],
+                ),
+                (
+                    users,
+                    [
+                        (
+                            "address_id",
+                            addresses["id"],
+                            "User {id}: address_id {value} not found",
+                        )
+                    ],
+                ),
+                (
+                    products,
+                    [
+                        (
+                            "category_id",
+                            categories["id"],
+                            "Product {id}: category_id {value} not found",
+                        )
+                    ],
+                ),
+            ]
 
-            # Check products -> categories
-            for product in products:
-                if (
-                    product.get("category_id")
-                    and product["category_id"] not in category_ids
-                ):
-                    self.errors["referential_integrity"].append(
-                        f"Product {product['id']}: category_id {product['category_id']} not found"
-                    )
+            # One hash join per FK; every FK of a row is reported together
+            for rows, foreign_keys in relations:
+                checks = []
+                for column, parent_ids, message in foreign_keys:
+                    refs = rows[column]
+                    missing = ~_falsy(refs) & ~refs.isin(parent_ids).to_numpy()
+                    checks.append((missing, message, refs.to_numpy()))
+
+                self._report(
+                    "errors",
+                    "referential_integrity",
+                    0,
+                    checks,
+                    ids=rows["id"].to_numpy(),
+                )
 
             if not self.errors.get("referential_integrity"):
                 logger.info("  ✓ All foreign keys are valid")
             else:
                 logger.error(
-                    f"  ✗ Found {len(self.errors['referential_integrity'])} FK violations"
+                    f"  ✗ Found {self.counts['errors']['referential_integrity']} FK violations"
                 )
 
         except Exception as e:
-            self.errors["referential_integrity"].append(f"Error checking FK: {str(e)}")
+            self._add("errors", "referential_integrity", f"Error checking FK: {str(e)}")
             logger.error(f"  ✗ Error checking referential integrity: {str(e)}")
 
-    def _load_json(self, filepath: Path) -> List[Dict]:
-        """Load JSON file"""
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+    def _load_json(self, filepath: Path) -> Iterator[Dict]:
+        """Yield records from a JSON array file (streamed when large)"""
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size < STREAM_THRESHOLD_BYTES:
+                yield from orjson.loads(f.read())
+            else:
+                yield from ijson.items(f, "item", use_float=True)
+
+    def _load_columns(
+        self, filepath: Path, columns: Tuple[str, ...]
+    ) -> Iterator[Tuple]:
+        """Yield the values of the given top-level keys for each record"""
+        pick = _picker(columns)
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size < STREAM_THRESHOLD_BYTES:
+                yield from map(pick, orjson.loads(f.read()))
+                return
+
+            # Large files: only the wanted scalars are built, not whole records
+            prefixes = {f"item.{c}": c for c in columns}
+            record = {}
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix in prefixes and event not in ("start_map", "start_array"):
+                    record[prefixes[prefix]] = value
+                elif prefix == "item" and event == "end_map":
+                    yield pick(record)
+                    record = {}
+
+    def _stream(self, filename: str) -> Iterator[Dict]:
+        """Stream records from a file in the data directory"""
+        return self._load_json(self.data_dir / filename)
+
+    def _columns(self, filename: str, columns: Tuple[str, ...]) -> pd.DataFrame:
+        """Id/FK columns of a file, reused from the first pass when available"""
+        df = self._fk_frames.get(filename)
+        if df is None:
+            records = self._load_columns(self.data_dir / filename, columns)
+            frames = [df for _, df in _frames(records, columns)]
+            if frames:
+                df = pd.concat(frames, ignore_index=True)
+            else:
+                df = pd.DataFrame(columns=list(columns), dtype=object)
+
+        if _absent(df["id"]).any():
+            raise KeyError("id")
+        return df
 
     def _print_validation_summary(self, results: Dict) -> None:
         """Print validation summary"""
@@ -291,8 +621,8 @@ class DataValidator:
 
         logger.info(f"Files checked: {results['files_checked']}")
         logger.info(f"Total records: {results['total_records']}")
-        logger.info(f"Errors: {sum(len(v) for v in results['errors'].values())}")
-        logger.info(f"Warnings: {sum(len(v) for v in results['warnings'].values())}")
+        logger.info(f"Errors: {sum(results['error_counts'].values())}")
+        logger.info(f"Warnings: {sum(results['warning_counts'].values())}")
 
         if results["errors"]:
             logger.error("\n❌ ERRORS FOUND:")
@@ -300,8 +630,9 @@ class DataValidator:
                 logger.error(f"\n  {file}:")
                 for error in errors[:5]:
                     logger.error(f"    • {error}")
-                if len(errors) > 5:
-                    logger.error(f"    ... and {len(errors) - 5} more")
+                total = results["error_counts"][file]
+                if total > 5:
+                    logger.error(f"    ... and {total - 5} more")
 
         if results["warnings"]:
             logger.warning("\n⚠️  WARNINGS:")
@@ -309,8 +640,12 @@ class DataValidator:
                 logger.warning(f"\n  {file}:")
                 for warning in warnings[:3]:
                     logger.warning(f"    • {warning}")
-                if len(warnings) > 3:
-                    logger.warning(f"    ... and {len(warnings) - 3} more")
+                total = results["warning_counts"][file]
+                if total > 3:
+                    logger.warning(f"    ... and {total - 3} more")
+
+        if self.report_path and not results["passed"]:
+            logger.info(f"\nDetailed report: {self.report_path}")
 
         if results["passed"]:
             logger.info("\n✅ ALL VALIDATIONS PASSED!")
@@ -320,11 +655,50 @@ class DataValidator:
         logger.info("=" * 80)
 
 
+def _validate_one_file(args: Tuple[str, Path, Optional[Path]]) -> Tuple[
+    str,
+    int,
+    List[str],
+    List[str],
+    Tuple[int, int],
+    Optional[str],
+    Optional[pd.DataFrame],
+]:
+    """
+    Validate one file in a worker process
+    Returns (filename, record_count, errors, warnings, counts, failure, fk_frame)
+    """
+    filename, filepath, report_path = args
+    validator = DataValidator(data_dir=filepath.parent, report_path=report_path)
+
+    try:
+        record_count = validator._validate_file(
+            filename, validator._load_json(filepath)
+        )
+        failure = None
+    except Exception as e:
+        record_count = 0
+        failure = str(e)
+        validator._add("errors", filename, f"Error reading file: {failure}")
+
+    return (
+        filename,
+        record_count,
+        validator.errors[filename],
+        validator.warnings[filename],
+        (validator.counts["errors"][filename], validator.counts["warnings"][filename]),
+        failure,
+        validator._fk_frames.get(filename),
+    )
+
+
 class DatabaseValidator:
     """Validate data in PostgreSQL database"""
 
-    def __init__(self, db_config: Dict[str, str]):
+    def __init__(self, db_config: Dict[str, str], report_path: Optional[Path] = None):
         self.db_config = db_config
+        # Optional NDJSON file receiving the rows that violate a foreign key
+        self.report_path = Path(report_path) if report_path else None
         self.conn = None
         self.cursor = None
 
@@ -340,6 +714,74 @@ class DatabaseValidator:
         if self.conn:
             self.conn.close()
 
+    def _report_fk_violations(self, table: str, column: str, parent: str) -> None:
+        """Stream rows of table whose column has no match in parent to the report"""
+        # Named cursor: rows are fetched from the server in batches
+        cursor = self.conn.cursor(name=f"fk_{table}_{column}")
+        cursor.itersize = FK_REPORT_BATCH_SIZE
+        try:
+            cursor.execute(
+                f"""
+                SELECT t.id, t.{column} FROM {table} t
+                WHERE t.{column} IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM {parent} p WHERE p.id = t.{column})
+            """
+            )
+            with open(self.report_path, "ab") as f:
+                while True:
+                    rows = cursor.fetchmany(FK_REPORT_BATCH_SIZE)
+                    if not rows:
+                        break
+                    f.write(
+                        b"".join(
+                            orjson.dumps(
+                                {
+                                    "table": table,
+                                    "id": row_id,
+                                    "column": column,
+                                    "value": value,
+                                },
+                                default=str,
+                            )
+                            + b"\n"
+                            for row_id, value in rows
+                        )
+                    )
+        finally:
+            cursor.close()
+
+    def _check_data_quality(self, results: Dict[str, Any]) -> None:
+        """Run DB_QUALITY_CHECKS with one scan per table in a single round-trip"""
+        logger.info("\n→ Checking data quality...")
+
+        tables = dict.fromkeys(table for table, *_ in DB_QUALITY_CHECKS)
+        checks = [c for t in tables for c in DB_QUALITY_CHECKS if c[0] == t]
+        subqueries = []
+        for table in tables:
+            counts = ", ".join(
+                f"COUNT(*) FILTER (WHERE {condition})"
+                for t, condition, _, _ in checks
+                if t == table
+            )
+            subqueries.append(f"(SELECT {counts} FROM {table}) AS {table}")
+
+        self.cursor.execute("SELECT * FROM " + ", ".join(subqueries))
+        row = self.cursor.fetchone()
+
+        for (_, _, label, kind), count in zip(checks, row):
+            if not count:
+                continue
+            if kind == "warning":
+                logger.warning(f"  ⚠ Found {count} {label}")
+                results["check_warnings"] += count
+            else:
+                logger.error(f"  ✗ Found {count} {label}")
+                key = "null_violations" if kind == "null" else "check_violations"
+                results[key] += count
+
+        if not results["null_violations"] and not results["check_violations"]:
+            logger.info("  ✓ Data quality checks: OK")
+
     def validate_database(self) -> Dict[str, Any]:
         """Validate database integrity"""
         logger.info("\n" + "=" * 80)
@@ -351,9 +793,15 @@ class DatabaseValidator:
             "total_records": 0,
             "fk_violations": 0,
             "null_violations": 0,
+            "check_violations": 0,
+            "check_warnings": 0,
             "passed": True,
         }
 
+        if self.report_path:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            self.report_path.write_bytes(b"")
+
         self.connect()
 
         try:
@@ -369,9 +817,16 @@ class DatabaseValidator:
                 "companies",
             ]
 
+            # Exact counts for all tables in a single round-trip
+            self.cursor.execute(
+                " UNION ALL ".join(
+                    f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+                )
+            )
+            counts = dict(self.cursor.fetchall())
+
             for table in tables:
-                self.cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = self.cursor.fetchone()[0]
+                count = counts[table]
                 logger.info(f"  • {table:20s}: {count:6d} records")
                 results["tables_checked"] += 1
                 results["total_records"] += count
@@ -379,45 +834,60 @@ class DatabaseValidator:
             # Check for FK violations (PostgreSQL should prevent these, but let's verify)
             logger.info("\n→ Checking foreign key constraints...")
 
-            # Check orders -> users
-            self.cursor.execute(
-                """
-                SELECT COUNT(*) FROM orders o
-                LEFT JOIN users u ON o.user_id = u.id
-                WHERE o.user_id IS NOT NULL AND u.id IS NULL
+            # Both FK checks in one round-trip; NOT EXISTS lets the planner
+            # use an anti-join against the parent primary key index
+            fk_query = """
+                SELECT 'orders', COUNT(*) FROM orders o
+                WHERE o.user_id IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM users u WHERE u.id = o.user_id)
+                UNION ALL
+                SELECT 'products', COUNT(*) FROM products p
+                WHERE p.category_id IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM categories c WHERE c.id = p.category_id)
             """
-            )
-            fk_violations = self.cursor.fetchone()[0]
+            if logger.isEnabledFor(logging.DEBUG):
+                self.cursor.execute("EXPLAIN ANALYZE " + fk_query)
+                for (line,) in self.cursor.fetchall():
+                    logger.debug(f"    {line}")
+
+            self.cursor.execute(fk_query)
+            fk_counts = dict(self.cursor.fetchall())
+
+            # Check orders -> users
+            fk_violations = fk_counts["orders"]
             if fk_violations > 0:
                 logger.error(f"  ✗ Found {fk_violations} orders with invalid user_id")
                 results["fk_violations"] += fk_violations
+                if self.report_path:
+                    self._report_fk_violations("orders", "user_id", "users")
             else:
                 logger.info("  ✓ orders -> users: OK")
 
             # Check products -> categories
-            self.cursor.execute(
-                """
-                SELECT COUNT(*) FROM products p
-                LEFT JOIN categories c ON p.category_id = c.id
-                WHERE p.category_id IS NOT NULL AND c.id IS NULL
-            """
-            )
-            fk_violations = self.cursor.fetchone()[0]
+            fk_violations = fk_counts["products"]
             if fk_violations > 0:
                 logger.error(
                     f"  ✗ Found {fk_violations} products with invalid category_id"
                 )
                 results["fk_violations"] += fk_violations
+                if self.report_path:
+                    self._report_fk_violations("products", "category_id", "categories")
             else:
                 logger.info("  ✓ products -> categories: OK")
 
+            self._check_data_quality(results)
+
             results["passed"] = (
-                results["fk_violations"] == 0 and results["null_violations"] == 0
+                results["fk_violations"] == 0
+                and results["null_violations"] == 0
+                and results["check_violations"] == 0
             )
 
             if results["passed"]:
                 logger.info("\n✅ DATABASE VALIDATION PASSED!")
             else:
+                if self.report_path and results["fk_violations"]:
+                    logger.info(f"\nViolating rows: {self.report_path}")
                 logger.error("\n❌ DATABASE VALIDATION FAILED!")
 
         finally:
@@ -432,13 +902,21 @@ def main():
     print("ETL DATA VALIDATION")
     print("=" * 80)
 
-    # Validate files
-    file_validator = DataValidator(data_dir=PROCESSED_DIR)
-    file_results = file_validator.validate_all_files()
-
-    # Validate database
-    db_validator = DatabaseValidator(DatabaseConfig.postgres())
-    db_results = db_validator.validate_database()
+    file_validator = DataValidator(
+        data_dir=PROCESSED_DIR, report_path=RESULTS_DIR / "validation_report.ndjson"
+    )
+    db_validator = DatabaseValidator(
+        DatabaseConfig.postgres(),
+        report_path=RESULTS_DIR / "db_validation_report.ndjson",
+    )
+
+    # Files and database share no state: DB queries wait on the server
+    # while the file checks run in their worker processes
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        file_future = executor.submit(file_validator.validate_all_files)
+        db_future = executor.submit(db_validator.validate_database)
+        file_results = file_future.result()
+        db_results = db_future.result()
 
     # Overall result
     if file_results["passed"] and db_results["passed"]: